@@ -0,0 +1,72 @@
+# Copyright 2024 DreamWorks Animation LLC
+# SPDX-License-Identifier: Apache-2.0
+
+# Builds the HTML documentation incrementally and in parallel.
+#
+# The doctree cache lives at the location set by doctreedir in conf.py
+# ($SPHINX_CACHE_DIR/doctrees, or ../.sphinx-cache/doctrees by default) so it
+# is never removed along with the build directory. Pass --clean to discard the
+# cache, which only happens when conf.py changed since the cache was written.
+
+import argparse
+import hashlib
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+CONF_FILE = os.path.join(DOCS_DIR, 'conf.py')
+OUTPUT_DIR = os.path.join(DOCS_DIR, '_build', 'html')
+
+
+def get_conf_hash():
+    with open(CONF_FILE, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def clean_doctrees(doctreedir):
+    # The hash of the conf.py used to build the cache is stored next to it
+    hash_file = os.path.join(os.path.dirname(doctreedir), 'conf.py.sha1')
+    conf_hash = get_conf_hash()
+    try:
+        with open(hash_file) as f:
+            cached_conf_hash = f.read()
+    except FileNotFoundError:
+        cached_conf_hash = None
+
+    if cached_conf_hash != conf_hash:
+        shutil.rmtree(doctreedir, ignore_errors=True)
+        os.makedirs(os.path.dirname(hash_file), exist_ok=True)
+        with open(hash_file, 'w') as f:
+            f.write(conf_hash)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Builds the HTML documentation"
+                                                 " reusing the cached doctrees")
+    parser.add_argument('--clean', action='store_true',
+                        help='remove the doctree cache if conf.py has changed '
+                             'since it was built')
+    args = parser.parse_args()
+
+    # conf.py uses paths relative to the docs directory, as under sphinx-build
+    os.chdir(DOCS_DIR)
+    doctreedir = runpy.run_path(CONF_FILE)['doctreedir']
+
+    if args.clean:
+        clean_doctrees(doctreedir)
+
+    # Read and write the documents in parallel, one process per core unless
+    # SPHINX_JOBS says otherwise
+    cmd = [sys.executable, '-m', 'sphinx',
+           '-j', os.environ.get('SPHINX_JOBS', 'auto'),
+           '-b', 'html',
+           '-d', doctreedir,
+           DOCS_DIR, OUTPUT_DIR]
+    sys.exit(subprocess.call(cmd))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,12 +7,9 @@
 #
 # This file is execfile()d with the current directory set to its containing dir.
 
-from distutils.errors import DistutilsFileError
+import configparser
 import os
-import pkg_resources
-from recommonmark.parser import CommonMarkParser
-from recommonmark.transform import AutoStructify
-import setuptools.config
+from packaging.version import InvalidVersion, Version
 import sys
 
 
@@ -26,12 +23,12 @@ sys.path.insert(0, os.path.abspath('../'))
 
 # If your documentation needs a minimal Sphinx version, state it here.
 #
-needs_sphinx = '1.8'
+needs_sphinx = '2.1'
 
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom ones.
 extensions = [
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinx.ext.doctest',
     'sphinx.ext.intersphinx',
     'sphinx.ext.todo',
@@ -40,48 +37,48 @@ extensions = [
     'sphinx.ext.viewcode',
     'sphinx.ext.napoleon',
     'sphinx.ext.extlinks',
-    'sphinx.ext.autosummary',
-    'sphinxcontrib.apidoc',
-    'sphinx.ext.mathjax',
+    'myst_parser',
     # 'nbsphinx',  # Uncomment for Jupyter Notebook support
 ]
 
-# Add any imports that Sphinx needs to mock when building. These are python
-# imports that are literally impossible to include in any virtualenv, such
-# as the 'nuke' and 'hou' modules that you get by launching Nuke and Houdini.
-# See http://mydw.anim.dreamworks.com/display/DTDDOC/ReadTheDocs+Walkthroughs
-# For more information
-autodoc_mock_imports = [
+# Highlighted source pages are written for every module, so they are only
+# built when asked for with SPHINX_VIEWCODE=1.
+if os.environ.get('SPHINX_VIEWCODE', '0') != '1':
+    extensions.remove('sphinx.ext.viewcode')
+
+# AutoAPI builds the API documentation by parsing the package sources, so
+# nothing (PyQt5 included) is imported and no imports need mocking.
+# Documentation: https://sphinx-autoapi.readthedocs.io/
+autoapi_type = 'python'
+autoapi_dirs = ['../render_profile_viewer']
+autoapi_root = 'api'
+autoapi_ignore = ['*/_version.py']
+autoapi_add_toctree_entry = False
+
+# autoapi_python_class_content is the option to show only the class docstring
+# with 'class', both class and __init__ with 'both' or just __init__ with 'init'
+autoapi_python_class_content = 'both'
+
+# These options control which members AutoAPI documents for classes and modules.
+# Inherited members are left out as they would re-document the whole Qt base
+# class of every widget; add :inherited-members: to a hand written page for a
+# class that needs them.
+# https://sphinx-autoapi.readthedocs.io/en/latest/reference/config.html#confval-autoapi_options
+autoapi_options = [
+    'members',
+    'undoc-members',
+    'show-inheritance',
 ]
 
-# autoclass_content is the option to show only the class docstring with 'class'
-# both class and __init__ with 'both'
-# or just __init__ with 'init'
-# If the class doesn't have __init__ or it isn't documented, __new__ is used.
-# http://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html#confval-autoclass_content
-autoclass_content = 'both'
-
-# These options control which methods and functions sphinx builds when it
-# documents a class and module.
-# You can choose to document specific special-members, etc.
-# Note that the 'member-order' option doesn't work. Alphabetical only.
-# http://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html#confval-autodoc_default_options
-autodoc_default_options = {
-    'members': None,  # None means all
-    'undoc-members': None,
-    'inherited-members': None,
-    'show-inheritance': None,
-}
-
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
-# The suffix of source filenames.
-source_suffix = '.rst'
-
-# Instructions for how to render different extensions
-source_parsers = {
-    '.md': CommonMarkParser,
+# The suffix of source filenames and the parser used for each of them.
+# Markdown is parsed by myst_parser, where reStructuredText can be embedded
+# with the {eval-rst} directive.
+source_suffix = {
+    '.rst': 'restructuredtext',
+    '.md': 'markdown',
 }
 
 # The master toctree document.
@@ -90,28 +87,31 @@ master_doc = 'index'
 # General information about the project.
 project = u'render_profile_viewer'
 
-# Apidoc controls how apidocumentation is built.
-# Documentation: https://github.com/sphinx-contrib/apidoc
-apidoc_module_dir = '../render_profile_viewer'
-apidoc_output_dir = 'api'
-apidoc_separate_modules = True
-apidoc_toc_file = False
-apidoc_excluded_paths = ['_version.py']
-apidoc_extra_args = ['-P', '-f']
-
 # The version info for the project you're documenting, acts as replacement for
 # |version| and |release|, also used in various other places throughout the
 # built documents.
-try:
-    config = setuptools.config.read_configuration(os.path.abspath('../setup.cfg'))
-except DistutilsFileError:
-    # No config file. This build will be without a version
-    pass
-else:
+# Only the version is needed from setup.cfg, so it is read with configparser
+# rather than paying for importing setuptools and pkg_resources.
+config = configparser.ConfigParser(interpolation=None)
+if config.read(os.path.abspath('../setup.cfg')):
     # The full version, including alpha/beta/rc tags.
-    release = pkg_resources.safe_version(config["metadata"]["version"])
+    release = config["metadata"]["version"]
+    try:
+        release = str(Version(release))
+    except InvalidVersion:
+        pass
     # The short X.Y version.
     version = '.'.join(release.split('.')[0:2])
+# Else there is no config file and this build will be without a version
+
+# Sphinx pickles the parsed sources (doctrees) into this directory. It is kept
+# outside of _build so it survives build directory cleanup and can be cached
+# between CI runs; only sources whose mtimes changed are re-read.
+# docs/build_docs.py passes this to sphinx-build with -d.
+doctreedir = os.path.join(
+    os.environ.get('SPHINX_CACHE_DIR', os.path.abspath('../.sphinx-cache')),
+    'doctrees'
+)
 
 # There are two options for replacing |today|: either, you set today to some
 # non-false value, then it is used:
@@ -145,7 +145,7 @@ todo_include_todos = True
 # nbsphinx_execute = 'never'
 
 # Use this kernel instead of the one stored in the notebook metadata:
-nbsphinx_kernel_name = 'python2'
+# nbsphinx_kernel_name = 'python3'
 
 # List of arguments to be passed to the kernel that executes the notebooks:
 # nbsphinx_execute_arguments = [
@@ -191,11 +191,17 @@ nbsphinx_kernel_name = 'python2'
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
 html_theme = 'sphinx_rtd_theme'
-# If you want a logo, add it to _static and uncomment the lines below.
+# Keep the sidebar collapsed to the top level sections. Expanding every entry
+# makes each page link to every other page, so the HTML size and the time
+# spent writing it grow with the square of the number of pages.
+# If you want a logo, add it to _static, uncomment html_logo and add
+# 'logo_only': True below.
 # html_logo = '_static/logo.png'
-# html_theme_options = {
-#     'logo_only': True,
-# }
+html_theme_options = {
+    'collapse_navigation': True,
+    'navigation_depth': 2,
+    'titles_only': True,
+}
 
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
@@ -260,16 +266,7 @@ intersphinx_mapping = {'http://docs.python.org/': None}
 extlinks = {'jira': ('http://jira.anim.dreamworks.com/browse/%s', '')}
 
 
-# Markdown Support
-
 def setup(app):
-    app.add_config_value(
-        'recommonmark_config', {
-            'enable_eval_rst': True,
-        },
-        True
-    )
-    app.add_transform(AutoStructify)
     # This adds wider margins
-    app.add_stylesheet('large_width.css')
+    app.add_css_file('large_width.css')
 
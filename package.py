@@ -13,26 +13,34 @@ authors = [
 # Supply arguments to the "python setup.py" call rez-build will make.
 # These are appended after "python setup.py build [install]"
 # Add --no-build-sphinx to disable the automatic building of docs.
+# To build the docs by hand, incrementally, run docs/build_docs.py. It runs
+# sphinx-build with a doctree cache (-d) that persists between builds.
 rez_build_args = {
     'python-3.7': ['--no-build-sphinx'],
 }
 
+# Imported once when package.py is loaded rather than on every preprocess().
+try:
+    import rezbuild.earlybind as _earlybind
+except ImportError:
+    _earlybind = None
+
+
 def preprocess(this, data):
-    from rez.package_py_utils import InvalidPackageError
-    try:
-        import rezbuild.earlybind
-    except ImportError:
+    if _earlybind is None:
+        from rez.package_py_utils import InvalidPackageError
         raise InvalidPackageError("The package cannot be configured because "
                                   "rezbuild.earlybind cannot be imported.")
-    rezbuild.earlybind.configure_package(this, data)
-    data["requires"].extend([
-    ])
+    _earlybind.configure_package(this, data)
 
 
+# This has to stay @late() and import os itself: rez serializes the function
+# body into the installed package, and the arguments are only known when
+# rez-test runs.
 @late()
 def test_arguments():
     import os
-    return os.getenv("REZ_TEST_ARGUMENTS", "")
+    return os.environ.get("REZ_TEST_ARGUMENTS", "")
 
 
 def commands():
@@ -1,8 +1,6 @@
 # Copyright 2023-2024 DreamWorks Animation LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from __future__ import absolute_import, division, print_function
-
 import logging
 
 # Setting top level logger according to library standard in
@@ -13,13 +11,25 @@ import logging
 # Users of this package are responsible for setting handlers
 # (i.e. logging.basicConfig()) and (optionally) set logging level using
 # render_profile_viewer.logger.setLevel() in order to see/configure logging output
+#
+# The NullHandler is only needed when no handler is configured yet, which also
+# avoids stacking another one each time the package is reloaded.
 logger = logging.getLogger(__name__)
-logger.addHandler(logging.NullHandler())
+if not logger.hasHandlers():
+    logger.addHandler(logging.NullHandler())
 
 
-try:
-    from ._version import __version__
-except ImportError:
-    logger.warning("Package needs built to expose an accurate version number.")
-    __version__ = '0.0.0'
+def __getattr__(name):
+    # The version is only read on first access (PEP 562) so that importing
+    # the package doesn't have to load _version. It is cached in the module
+    # globals afterwards, which bypasses this function.
+    if name == '__version__':
+        try:
+            from ._version import __version__
+        except ImportError:
+            logger.warning("Package needs built to expose an accurate version number.")
+            __version__ = '0.0.0'
+        globals()['__version__'] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -3,33 +3,197 @@
 
 from PyQt5 import QtWidgets, QtCore, QtChart, QtGui
 import os
-import fnmatch
-import json
 import sys
-import shutil
 import argparse
 import subprocess
-import copy
 import re
-import datetime
+import time
+import collections
+import functools
+import hashlib
+import tempfile
+import concurrent.futures
+import multiprocessing
+from types import MappingProxyType
 
 from render_profile_viewer._version import __version__
+from render_profile_viewer.parser import (DEFAULT_PROFILE_DIRECTORY, MEMORY_STATS, RENDER_PREP_STATS, parse_log_file,
+                                          list_test_dirs, list_test_logs, get_week_log_path, get_cache_file_name,
+                                          read_cache_file, write_cache_file)
+
+
+# Upper bound on the memory held by the pixmaps kept in MyWindow.images_cache
+IMAGES_CACHE_BYTES = 512 * 1024 * 1024
+
+# Number of scaled pixmaps kept in MyWindow.scaled_images_cache
+SCALED_IMAGES_CACHE_SIZE = 32
+
+# Number of parsed logs and json cache files kept in MyWindow.log_stats_cache
+LOG_STATS_CACHE_SIZE = 256
+
+# Total size of the logs to parse above which they are parsed by worker processes
+PARALLEL_PARSE_BYTES = 32 * 1024 * 1024
+
+# Application palette colors of each theme
+THEME_COLORS = MappingProxyType({
+    "dark": MappingProxyType({QtGui.QPalette.Window: (50, 50, 50),
+                              QtGui.QPalette.Button: (70, 70, 70),
+                              QtGui.QPalette.ButtonText: (255, 255, 255),
+                              QtGui.QPalette.WindowText: (255, 255, 255),
+                              QtGui.QPalette.Text: (255, 255, 255),
+                              QtGui.QPalette.Base: (70, 70, 70)}),
+    "light": MappingProxyType({QtGui.QPalette.Window: (239, 239, 239),
+                               QtGui.QPalette.Button: (239, 239, 239),
+                               QtGui.QPalette.ButtonText: (0, 0, 0),
+                               QtGui.QPalette.WindowText: (0, 0, 0),
+                               QtGui.QPalette.Text: (0, 0, 0),
+                               QtGui.QPalette.Base: (255, 255, 255)}),
+})
+
+
+@functools.lru_cache(maxsize=64)
+def get_search_pattern(search_text):
+    # Case insensitive like QTextDocument.find
+    return re.compile(re.escape(search_text), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def get_base_palette(rgba):
+    # Palette whose Base (the checkbox indicator background) is the given color,
+    # shared by the checkboxes using the same color
+    palette = QtGui.QPalette()
+    palette.setColor(QtGui.QPalette.Base, QtGui.QColor.fromRgba(rgba))
+    return palette
+
+
+def remove_tree(path):
+    # os.scandir already knows which entries are directories, so unlike
+    # shutil.rmtree nothing needs another stat call
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+class RemoveTreeSignals(QtCore.QObject):
+
+    # Path of the removed directory and an error message, empty on success
+    finished = QtCore.pyqtSignal(str, str)
+
+
+class RemoveTreeRunnable(QtCore.QRunnable):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = RemoveTreeSignals()
+
+    def run(self):
+        error = ""
+        try:
+            remove_tree(self.path)
+        except OSError as e:
+            error = str(e)
+        self.signals.finished.emit(self.path, error)
+
+
+class ScanTestsSignals(QtCore.QObject):
 
+    # Profile directory, names of its test directories and an error message, empty on success
+    finished = QtCore.pyqtSignal(str, list, str)
 
-def get_seconds_from_time(time_string):
-    hours = float(time_string.split(':')[-3])
-    minutes = float(time_string.split(':')[-2])
-    seconds = float(time_string.split(':')[-1])
-    return seconds + minutes * 60.0 + hours * 3600.0
 
+class ScanTestsRunnable(QtCore.QRunnable):
+    def __init__(self, profile_directory):
+        super().__init__()
+        self.profile_directory = profile_directory
+        self.signals = ScanTestsSignals()
+
+    def run(self):
+        test_names = list()
+        error = ""
+        try:
+            test_names = list_test_dirs(self.profile_directory)
+        except OSError as e:
+            error = str(e)
+        self.signals.finished.emit(self.profile_directory, test_names, error)
+
+
+def add_log_file_to_list(log_file, rows):
+    extension = os.path.splitext(log_file)[1]
+    if extension != '.txt' and extension != '.log':
+        return
+    user_role_dict = dict()
+    path = os.path.abspath(log_file)
+    name = os.path.basename(path)
+    user_role_dict["name"] = name
+    user_role_dict["path"] = path
+    rows.append(user_role_dict)
+
+
+def add_log_files_to_list(log_file, rows):
+    # Directories are walked with a stack rather than recursion, however deep they are
+    log_files = [log_file]
+    while log_files:
+        log_file = log_files.pop()
+        if os.path.isdir(log_file):
+            with os.scandir(log_file) as files:
+                log_files.extend(f.path for f in files)
+        else:
+            add_log_file_to_list(log_file, rows)
+
+
+class ScanLogsSignals(QtCore.QObject):
+
+    # Rows of the logs found, sorted by path, and an error message, empty on success
+    finished = QtCore.pyqtSignal(list, str)
+
+
+class ScanLogsRunnable(QtCore.QRunnable):
+    def __init__(self, log_files):
+        super().__init__()
+        self.log_files = log_files
+        self.signals = ScanLogsSignals()
 
-def get_gigabytes_from_size(size_string, size_unit):
-    if size_unit == "GB":
-        return float(size_string)
-    elif size_unit == "MB":
-        return float(size_string) / 1024
-    elif size_unit == "KB":
-        return float(size_string) / 1024 / 1024
+    def run(self):
+        rows = list()
+        error = ""
+        try:
+            for log_file in self.log_files:
+                add_log_files_to_list(log_file, rows)
+        except OSError as e:
+            error = str(e)
+        rows.sort(key=lambda row: row["path"])
+        self.signals.finished.emit(rows, error)
+
+
+def read_log_text(log_file):
+    if not os.path.exists(log_file):
+        return f"Log: {log_file} does not exist"
+    with open(log_file, 'r', errors='replace') as log_file:
+        return log_file.read()
+
+
+class ReadLogSignals(QtCore.QObject):
+
+    # Text of the log, or a message saying why it couldn't be read
+    finished = QtCore.pyqtSignal(str)
+
+
+class ReadLogRunnable(QtCore.QRunnable):
+    def __init__(self, log_file):
+        super().__init__()
+        self.log_file = log_file
+        self.signals = ReadLogSignals()
+
+    def run(self):
+        try:
+            log_text = read_log_text(self.log_file)
+        except OSError as e:
+            log_text = f"Log: {self.log_file} could not be read: {e}"
+        self.signals.finished.emit(log_text)
 
 
 # noinspection PyUnresolvedReferences
@@ -37,9 +201,7 @@ class RenderProfileChartView(QtChart.QChartView):
 
     stat_signal = QtCore.pyqtSignal(str)
 
-    stat_colors = dict()
-
-    stat_colors_values = {
+    stat_colors_values = MappingProxyType({
                    # Render prep
                    "Checkout license":                      (50, 50, 50),
                    "Loading scene":                         (50, 50, 80),
@@ -86,7 +248,9 @@ class RenderProfileChartView(QtChart.QChartView):
                    # memory
                    "Geometry memory":                       (100, 200, 50),
                    "BVH memory":                            (50, 100, 200),
-                   "MCRT memory":                           (200, 50, 100)}
+                   "MCRT memory":                           (200, 50, 100)})
+
+    stat_colors = MappingProxyType({stat_name: QtGui.QColor(*rgb) for stat_name, rgb in stat_colors_values.items()})
 
     improvements_color = QtGui.QColor(0, 200, 0)
     regression_color = QtGui.QColor(200, 0, 0)
@@ -94,19 +258,19 @@ class RenderProfileChartView(QtChart.QChartView):
     crash_color = QtGui.QColor(255, 0, 0)
     missing_color = QtGui.QColor(200, 0, 0)
 
-    memory_stats = ["Geometry memory",
-                    "BVH memory",
-                    "MCRT memory"]
+    # Outline color of each bar set built per stat, None for no outline
+    overlay_colors = (None,
+                      regression_color,
+                      improvements_color,
+                      fallback_color,
+                      crash_color,
+                      None)
+
+    memory_stats = MEMORY_STATS
 
-    render_prep_stats = ["Checkout license",
-                         "Loading scene",
-                         "Initialize renderer",
-                         "Generating procedurals",
-                         "Tessellation",
-                         "Building BVH",
-                         "Building GPU BVH"]
+    render_prep_stats = RENDER_PREP_STATS
 
-    scalar_stats = ["Render driver overhead",
+    scalar_stats = ("Render driver overhead",
                     "Adaptive tree query",
                     "Adaptive tree exclusive lock",
                     "Render driver serial time",
@@ -124,54 +288,86 @@ class RenderProfileChartView(QtChart.QChartView):
                     "Adaptive tree rebuild",
                     "Add sample handler",
                     "AOVs",
-                    "MISSING TIME"]
+                    "MISSING TIME")
 
-    vector_stats = ["RayState allocs",
+    vector_stats = ("RayState allocs",
                     "Ray handler (excl. embree)",
                     "Shade handler (excl. isect+shading)",
                     "Queuing logic (incl. sorting)",
                     "Occl query handler (excl. embree)",
                     "TLS allocs (excl. RayStates)",
-                    "Post integration (SOA->AOS/queuing)"]
+                    "Post integration (SOA->AOS/queuing)")
+
+    xpu_stats = ("GPU occlusion rays",)
+
+    # For the membership tests done on every chart update
+    memory_stats_set = frozenset(memory_stats)
+
+    # The timing stats disabled while pixel samples or memory are shown
+    time_stats_set = frozenset(render_prep_stats + scalar_stats + vector_stats + xpu_stats)
 
-    xpu_stats = ["GPU occlusion rays"]
+    line_series_colors = MappingProxyType({"scalar": (255, 0, 0),
+                                           "vector": (0, 255, 0),
+                                           "xpu": (0, 0, 255)})
+
+    # Keyboard navigation: scroll offsets and QChart zoom methods per key
+    scroll_keys = MappingProxyType({QtCore.Qt.Key_Up: (0, 20),
+                                    QtCore.Qt.Key_W: (0, 20),
+                                    QtCore.Qt.Key_Down: (0, -20),
+                                    QtCore.Qt.Key_S: (0, -20),
+                                    QtCore.Qt.Key_Right: (20, 0),
+                                    QtCore.Qt.Key_D: (20, 0),
+                                    QtCore.Qt.Key_Left: (-20, 0),
+                                    QtCore.Qt.Key_A: (-20, 0)})
+
+    zoom_keys = MappingProxyType({QtCore.Qt.Key_Equal: 'zoomIn',
+                                  QtCore.Qt.Key_E: 'zoomIn',
+                                  QtCore.Qt.Key_Minus: 'zoomOut',
+                                  QtCore.Qt.Key_Q: 'zoomOut',
+                                  QtCore.Qt.Key_Home: 'zoomReset',
+                                  QtCore.Qt.Key_R: 'zoomReset'})
 
     def __init__(self):
         super().__init__()
 
-        self.stat_colors.clear()
-        for stat_name in self.stat_colors_values.keys():
-            stat_color = QtGui.QColor(int(self.stat_colors_values[stat_name][0]),
-                                      int(self.stat_colors_values[stat_name][1]),
-                                      int(self.stat_colors_values[stat_name][2]))
-            self.stat_colors[stat_name] = stat_color
-
         self.series = QtChart.QStackedBarSeries()
 
         self.setRenderHint(QtGui.QPainter.Antialiasing)
 
         self.max_y = 0.0
 
+        # The rendered chart is kept in a pixmap and blitted on repaint until
+        # the scene changes or the view is resized
+        self.cached_pixmap = None
+        self.scene().changed.connect(self.invalidate_cache)
+
+    def invalidate_cache(self):
+        self.cached_pixmap = None
+
+    def paintEvent(self, event):
+        viewport = self.viewport()
+        pixel_ratio = viewport.devicePixelRatioF()
+        pixmap_size = viewport.size() * pixel_ratio
+        if self.cached_pixmap is None or self.cached_pixmap.size() != pixmap_size:
+            self.cached_pixmap = QtGui.QPixmap(pixmap_size)
+            self.cached_pixmap.setDevicePixelRatio(pixel_ratio)
+            self.cached_pixmap.fill(viewport.palette().color(viewport.backgroundRole()))
+            pixmap_painter = QtGui.QPainter(self.cached_pixmap)
+            pixmap_painter.setRenderHints(self.renderHints())
+            # render draws the scene directly, it doesn't go through paintEvent
+            self.render(pixmap_painter, QtCore.QRectF(viewport.rect()), viewport.rect())
+            pixmap_painter.end()
+
+        painter = QtGui.QPainter(viewport)
+        painter.drawPixmap(0, 0, self.cached_pixmap)
+        painter.end()
+
     def keyPressEvent(self, event):
-        keymap = {
-            QtCore.Qt.Key_Up: lambda: self.chart().scroll(0, 20),
-            QtCore.Qt.Key_W: lambda: self.chart().scroll(0, 20),
-            QtCore.Qt.Key_Down: lambda: self.chart().scroll(0, -20),
-            QtCore.Qt.Key_S: lambda: self.chart().scroll(0, -20),
-            QtCore.Qt.Key_Right: lambda: self.chart().scroll(20, 0),
-            QtCore.Qt.Key_D: lambda: self.chart().scroll(20, 0),
-            QtCore.Qt.Key_Left: lambda: self.chart().scroll(-20, 0),
-            QtCore.Qt.Key_A: lambda: self.chart().scroll(-20, 0),
-            QtCore.Qt.Key_Equal: self.chart().zoomIn,
-            QtCore.Qt.Key_E: self.chart().zoomIn,
-            QtCore.Qt.Key_Minus: self.chart().zoomOut,
-            QtCore.Qt.Key_Q: self.chart().zoomOut,
-            QtCore.Qt.Key_Home: self.chart().zoomReset,
-            QtCore.Qt.Key_R: self.chart().zoomReset
-        }
-        callback = keymap.get(event.key())
-        if callback:
-            callback()
+        key = event.key()
+        if key in self.scroll_keys:
+            self.chart().scroll(*self.scroll_keys[key])
+        elif key in self.zoom_keys:
+            getattr(self.chart(), self.zoom_keys[key])()
 
     def hover_bar_series(self, status, index, barset):
         if status:
@@ -229,157 +425,84 @@ class RenderProfileChartView(QtChart.QChartView):
                                    stat_name, stats_dict, prev_stats_dict, extra_stats_dict,
                                    show_regressions, show_improvements,
                                    regressions_threshold, improvements_threshold,
-                                   main_bar_set, regressions_bar_set,
-                                   improvements_bar_set,
-                                   fallback_bar_set, fallback,
-                                   crash_bar_set, crash,
-                                   missing_bar_set, missing):
+                                   main_values, regressions_values,
+                                   improvements_values,
+                                   fallback_values, fallback,
+                                   crash_values, crash,
+                                   missing_values, missing):
 
         stat = self.get_stat(stats_dict, extra_stats_dict, stat_name, test_type, week)
-        if week_index > 0 and prev_stats_dict[test_type] != 0 and (show_regressions or show_improvements):
+
+        stat_ratio = None
+        if week_index > 0 and prev_stats_dict[test_type] != 0:
             stat_ratio = stat / prev_stats_dict[test_type]
-            if missing:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            elif fallback:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(stat)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            elif crash:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(stat)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            elif stat_ratio > regressions_threshold and show_regressions:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(stat)
-            elif stat_ratio < improvements_threshold and show_improvements:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(stat)
-                regressions_bar_set.append(0)
-            else:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(stat)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-        else:
-            if missing:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            elif fallback:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(stat)
-                crash_bar_set.append(0)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            elif crash:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(stat)
-                main_bar_set.append(0)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
-            else:
-                missing_bar_set.append(0)
-                fallback_bar_set.append(0)
-                crash_bar_set.append(0)
-                main_bar_set.append(stat)
-                improvements_bar_set.append(0)
-                regressions_bar_set.append(0)
         prev_stats_dict[test_type] = stat
 
+        # The stat goes in exactly one of the bar sets, the others get a 0
+        if missing:
+            stat_values = missing_values
+            stat = 0
+        elif fallback:
+            stat_values = fallback_values
+        elif crash:
+            stat_values = crash_values
+        elif show_regressions and stat_ratio is not None and stat_ratio > regressions_threshold:
+            stat_values = regressions_values
+        elif show_improvements and stat_ratio is not None and stat_ratio < improvements_threshold:
+            stat_values = improvements_values
+        else:
+            stat_values = main_values
+
+        for values in (main_values, regressions_values, improvements_values,
+                       fallback_values, crash_values, missing_values):
+            values.append(stat if values is stat_values else 0)
+
     @staticmethod
     def add_line_series(chart,
                         x_axis,
                         y_axis,
                         stats_dict,
                         type_visibility_list):
-        scalar_pen = QtGui.QPen()
-        scalar_pen.setWidth(3)
-        scalar_pen.setColor(QtGui.QColor(255, 0, 0))
-        scalar_line_series = QtChart.QLineSeries()
-        scalar_line_series.setPen(scalar_pen)
-
-        vector_pen = QtGui.QPen()
-        vector_pen.setWidth(3)
-        vector_pen.setColor(QtGui.QColor(0, 255, 0))
-        vector_line_series = QtChart.QLineSeries()
-        vector_line_series.setPen(vector_pen)
-
-        xpu_pen = QtGui.QPen()
-        xpu_pen.setWidth(3)
-        xpu_pen.setColor(QtGui.QColor(0, 0, 255))
-        xpu_line_series = QtChart.QLineSeries()
-        xpu_line_series.setPen(xpu_pen)
+        # Only the visible types get a line series
+        line_series_dict = dict()
+        for test_type, rgb in RenderProfileChartView.line_series_colors.items():
+            if test_type in type_visibility_list:
+                pen = QtGui.QPen()
+                pen.setWidth(3)
+                pen.setColor(QtGui.QColor(*rgb))
+                line_series_dict[test_type] = QtChart.QLineSeries()
+                line_series_dict[test_type].setPen(pen)
 
         x = 0
         for week_index, week in enumerate(stats_dict.keys()):
             for test_type in ['scalar', 'vector', 'xpu']:
                 if test_type in stats_dict[week] and \
                    stats_dict[week][test_type] and \
-                   test_type in type_visibility_list:
+                   test_type in line_series_dict:
 
                     if stats_dict[week][test_type] == "missing":
                         visible_time = 0
                     else:
                         visible_time = float(stats_dict[week][test_type]['visible_time'])
 
-                    if test_type == 'scalar':
-                        scalar_line_series.append(x, visible_time)
-                    if test_type == 'vector':
-                        vector_line_series.append(x, visible_time)
-                    if test_type == 'xpu':
-                        xpu_line_series.append(x, visible_time)
+                    line_series_dict[test_type].append(x, visible_time)
                     x += 1
-        chart.addSeries(scalar_line_series)
-        chart.addSeries(vector_line_series)
-        chart.addSeries(xpu_line_series)
 
-        scalar_line_series.attachAxis(x_axis)
-        scalar_line_series.attachAxis(y_axis)
-        vector_line_series.attachAxis(x_axis)
-        vector_line_series.attachAxis(y_axis)
-        xpu_line_series.attachAxis(x_axis)
-        xpu_line_series.attachAxis(y_axis)
+        for line_series in line_series_dict.values():
+            chart.addSeries(line_series)
+            line_series.attachAxis(x_axis)
+            line_series.attachAxis(y_axis)
 
     @staticmethod
-    def check_host_type(stats_dict, week, test_type, host_visibility_list):
-        if len(host_visibility_list) == 0:
+    def check_host_type(stats_dict, week, test_type, host_prefixes):
+        # host_prefixes is a tuple so startswith can test all of them at once
+        if not host_prefixes:
             return True
 
         if 'host_name' not in stats_dict[week][test_type]:
             return True
 
-        host_name = stats_dict[week][test_type]['host_name']
-
-        for host_type in host_visibility_list:
-            if host_name.startswith(host_type):
-                return True
-
-        return False
+        return stats_dict[week][test_type]['host_name'].startswith(host_prefixes)
 
     def update_chart(self,
                      test_name,
@@ -403,203 +526,339 @@ class RenderProfileChartView(QtChart.QChartView):
                      show_crash=False,
                      label_angle=90):
 
-        regressions_threshold = (100.0 + regressions_threshold) / 100.0
-        improvements_threshold = (100.0 - improvements_threshold) / 100.0
+        # Don't repaint while the chart and its hundreds of bar sets are built
+        self.invalidate_cache()
+        self.setUpdatesEnabled(False)
+        try:
+            regressions_threshold = (100.0 + regressions_threshold) / 100.0
+            improvements_threshold = (100.0 - improvements_threshold) / 100.0
 
-        chart = QtChart.QChart()
-        chart.setTitle(test_name)
+            chart = QtChart.QChart()
+            chart.setAnimationOptions(QtChart.QChart.NoAnimation)
+            chart.setTitle(test_name)
 
-        if dark_theme:
-            chart.setTheme(QtChart.QChart.ChartThemeDark)
+            if dark_theme:
+                chart.setTheme(QtChart.QChart.ChartThemeDark)
 
-        title_font = chart.titleFont()
-        title_font.setPointSize(font_size)
-        chart.setTitleFont(title_font)
-        self.setChart(chart)
+            title_font = chart.titleFont()
+            title_font.setPointSize(font_size)
+            chart.setTitleFont(title_font)
+            self.setChart(chart)
 
-        if len(stats_dict) == 0:
-            return
+            if len(stats_dict) == 0:
+                return
 
-        stacked_bar_series = QtChart.QStackedBarSeries()
-        stacked_bar_series.hovered.connect(self.hover_bar_series)
+            stacked_bar_series = QtChart.QStackedBarSeries()
+            stacked_bar_series.hovered.connect(self.hover_bar_series)
 
-        if show_pixel_samples:
-            stat_names = ['pixel_samples']
-        else:
-            stat_names = self.stat_colors.keys()
+            if show_pixel_samples:
+                stat_names = ['pixel_samples']
+            else:
+                stat_names = self.stat_colors.keys()
 
-        categories = list()
-        for stat_name in stat_names:
-           if not stat_visibility_list or (not show_pixel_samples and stat_name not in stat_visibility_list):
-                continue
+            # Sets for the membership tests done for every week and type
+            type_visible = set(type_visibility_list or ())
+            stat_visible = set(stat_visibility_list or ())
+            host_prefixes = tuple(host_visibility_list or ())
 
-            main_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                main_bar_set.setColor(self.stat_colors[stat_name])
-
-            regressions_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                regressions_bar_set.setColor(self.stat_colors[stat_name])
-            overlay_pen = regressions_bar_set.pen()
-            overlay_pen.setWidth(5)
-            overlay_pen.setColor(self.regression_color)
-            regressions_bar_set.setPen(overlay_pen)
-
-            improvements_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                improvements_bar_set.setColor(self.stat_colors[stat_name])
-            overlay_pen = improvements_bar_set.pen()
-            overlay_pen.setWidth(5)
-            overlay_pen.setColor(self.improvements_color)
-            improvements_bar_set.setPen(overlay_pen)
-
-            fallback_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                fallback_bar_set.setColor(self.stat_colors[stat_name])
-            overlay_pen = fallback_bar_set.pen()
-            overlay_pen.setWidth(5)
-            overlay_pen.setColor(self.fallback_color)
-            fallback_bar_set.setPen(overlay_pen)
-
-            crash_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                crash_bar_set.setColor(self.stat_colors[stat_name])
-            overlay_pen = crash_bar_set.pen()
-            overlay_pen.setWidth(5)
-            overlay_pen.setColor(self.crash_color)
-            crash_bar_set.setPen(overlay_pen)
-
-            missing_bar_set = QtChart.QBarSet(stat_name)
-            if stat_name in self.stat_colors:
-                missing_bar_set.setColor(self.stat_colors[stat_name])
-
-            extra_stats_dict = dict()
-            extra_stats_dict['visible_time'] = list()
-            extra_stats_dict['total_render_prep_time'] = list()
-            extra_stats_dict['total_mcrt_time'] = list()
-            extra_stats_dict['pixel_samples'] = list()
-            extra_stats_dict['host_name'] = list()
-
-            prev_stats_dict = dict()
-            prev_stats_dict['scalar'] = 0
-            prev_stats_dict['vector'] = 0
-            prev_stats_dict['xpu'] = 0
-
-            for week_index, week in enumerate(stats_dict.keys()):
-                for test_type in ['scalar', 'vector', 'xpu']:
-                    if test_type in stats_dict[week] and test_type in type_visibility_list:
-
-                        if not stats_dict[week][test_type]:
-                            continue
-
-                        # Check for missing week
-                        missing = False
-                        if stats_dict[week][test_type] == "missing":
-                            missing = True
-
-                        # Check for host type
-                        if not self.check_host_type(stats_dict, week, test_type, host_visibility_list):
-                            continue
-
-                        # Categories (bottom of chart)
-                        if missing:
-                            categories.append(f"MISSING! - {week} ({test_type})")
-                        elif show_host_names:
-                            host_name = 'Unknown'
-                            if 'host_name' in stats_dict[week][test_type]:
-                                host_name = stats_dict[week][test_type]['host_name'].split('.')[0]
-                            if show_fallback and \
-                               'fallback' in stats_dict[week][test_type] and \
-                               'fallback_mode' in stats_dict[week][test_type]:
-
-                                categories.append(f"{host_name}: {week} "
-                                                  f"({test_type} -> {stats_dict[week][test_type]['fallback_mode']})")
-                            else:
-                                categories.append(f"{host_name}: {week} ({test_type})")
-                        else:
-                            if show_fallback and \
-                               'fallback' in stats_dict[week][test_type] and \
-                               'fallback_mode' in stats_dict[week][test_type]:
+            categories = list()
+            for stat_name in stat_names:
+                if not stat_visible or (not show_pixel_samples and stat_name not in stat_visible):
+                    continue
 
-                                categories.append(f"{week} "
-                                                  f"({test_type} -> {stats_dict[week][test_type]['fallback_mode']})")
+                stat_color = self.stat_colors.get(stat_name)
+
+                # Main, regressions, improvements, fallback, crash and missing
+                # bar sets, in the order they are stacked
+                bar_sets = list()
+                for overlay_color in self.overlay_colors:
+                    bar_set = QtChart.QBarSet(stat_name)
+                    if stat_color is not None:
+                        bar_set.setColor(stat_color)
+                    if overlay_color is not None:
+                        overlay_pen = bar_set.pen()
+                        overlay_pen.setWidth(5)
+                        overlay_pen.setColor(overlay_color)
+                        bar_set.setPen(overlay_pen)
+                    bar_sets.append(bar_set)
+
+                extra_stats_dict = dict()
+                extra_stats_dict['visible_time'] = list()
+                extra_stats_dict['total_render_prep_time'] = list()
+                extra_stats_dict['total_mcrt_time'] = list()
+                extra_stats_dict['pixel_samples'] = list()
+                extra_stats_dict['host_name'] = list()
+
+                # Values are collected in plain lists and handed to each bar set
+                # in a single append once all the weeks are processed
+                main_values = list()
+                regressions_values = list()
+                improvements_values = list()
+                fallback_values = list()
+                crash_values = list()
+                missing_values = list()
+
+                prev_stats_dict = dict()
+                prev_stats_dict['scalar'] = 0
+                prev_stats_dict['vector'] = 0
+                prev_stats_dict['xpu'] = 0
+
+                for week_index, week in enumerate(stats_dict.keys()):
+                    for test_type in ['scalar', 'vector', 'xpu']:
+                        if test_type in stats_dict[week] and test_type in type_visible:
+
+                            entry = stats_dict[week][test_type]
+                            if not entry:
+                                continue
+
+                            # Check for missing week
+                            missing = entry == "missing"
+
+                            # Check for host type
+                            if not self.check_host_type(stats_dict, week, test_type, host_prefixes):
+                                continue
+
+                            # Categories (bottom of chart)
+                            if missing:
+                                categories.append(f"MISSING! - {week} ({test_type})")
                             else:
-                                categories.append(f"{week} ({test_type})")
-
-                        # Check for fallback
-                        fallback = False
-                        if show_fallback and 'fallback' in stats_dict[week][test_type]:
-                            fallback = stats_dict[week][test_type]['fallback']
-
-                        # Check for crash
-                        crash = False
-                        if show_crash and 'crash' in stats_dict[week][test_type]:
-                            crash = stats_dict[week][test_type]['crash']
-
-                        self.process_test_type_for_week(test_type,
-                                                        week, week_index,
-                                                        stat_name, stats_dict, prev_stats_dict, extra_stats_dict,
-                                                        show_regressions, show_improvements,
-                                                        regressions_threshold, improvements_threshold,
-                                                        main_bar_set, regressions_bar_set, improvements_bar_set,
-                                                        fallback_bar_set, fallback,
-                                                        crash_bar_set, crash,
-                                                        missing_bar_set, missing)
-
-            for bar_set in [main_bar_set, regressions_bar_set, improvements_bar_set, fallback_bar_set, crash_bar_set, missing_bar_set]:
-                for extra_stat in extra_stats_dict:
-                    bar_set.setProperty(extra_stat, extra_stats_dict[extra_stat])
-                stacked_bar_series.append(bar_set)
-
-        chart.addSeries(stacked_bar_series)
-
-        x_axis = QtChart.QBarCategoryAxis()
-        x_axis.append(categories)
-        x_axis.setLabelsAngle(label_angle)
-        if show_host_names:
-            x_axis.setTitleText("Host: Date (Type)")
-        else:
-            x_axis.setTitleText("Date (Type)")
-        title_font = x_axis.titleFont()
-        title_font.setPointSize(font_size)
-        x_axis.setTitleFont(title_font)
-        labels_font = x_axis.labelsFont()
-        labels_font.setPointSize(font_size * 0.75)
-        x_axis.setLabelsFont(labels_font)
-        chart.addAxis(x_axis, QtCore.Qt.AlignBottom)
-        stacked_bar_series.attachAxis(x_axis)
-
-        y_axis = QtChart.QValueAxis()
-        if divide_by_ps:
-            y_axis.setTitleText("Time per pixel sample (seconds)")
-        elif show_pixel_samples:
-            y_axis.setTitleText("Pixel Samples (millions)")
-        elif show_memory:
-            y_axis.setTitleText("Memory (GB)")
-        else:
-            y_axis.setTitleText("Time (seconds)")
-        labels_font = y_axis.labelsFont()
-        labels_font.setPointSize(font_size)
-        y_axis.setLabelsFont(labels_font)
-        title_font = y_axis.titleFont()
-        title_font.setPointSize(font_size)
-        y_axis.setTitleFont(title_font)
-        chart.addAxis(y_axis, QtCore.Qt.AlignLeft)
-        stacked_bar_series.attachAxis(y_axis)
-
-        if not resize:
-            # Set the saved size
-            y_axis.setMax(self.max_y)
-        self.max_y = y_axis.max()
-
-        chart.legend().setVisible(False)
-
-        if show_line_series:
-            self.add_line_series(chart,
-                                 x_axis,
-                                 y_axis,
-                                 stats_dict,
-                                 type_visibility_list)
+                                host_prefix = ''
+                                if show_host_names:
+                                    host_prefix = f"{entry.get('host_name', 'Unknown').partition('.')[0]}: "
+                                fallback_suffix = ''
+                                if show_fallback and 'fallback' in entry and 'fallback_mode' in entry:
+                                    fallback_suffix = f" -> {entry['fallback_mode']}"
+                                categories.append(f"{host_prefix}{week} ({test_type}{fallback_suffix})")
+
+                            # Check for fallback
+                            fallback = False
+                            if show_fallback and 'fallback' in entry:
+                                fallback = entry['fallback']
+
+                            # Check for crash
+                            crash = False
+                            if show_crash and 'crash' in entry:
+                                crash = entry['crash']
+
+                            self.process_test_type_for_week(test_type,
+                                                            week, week_index,
+                                                            stat_name, stats_dict, prev_stats_dict, extra_stats_dict,
+                                                            show_regressions, show_improvements,
+                                                            regressions_threshold, improvements_threshold,
+                                                            main_values, regressions_values, improvements_values,
+                                                            fallback_values, fallback,
+                                                            crash_values, crash,
+                                                            missing_values, missing)
+
+                bar_sets_values = (main_values, regressions_values, improvements_values,
+                                   fallback_values, crash_values, missing_values)
+                for bar_set, values in zip(bar_sets, bar_sets_values):
+                    bar_set.append(values)
+                    for extra_stat in extra_stats_dict:
+                        bar_set.setProperty(extra_stat, extra_stats_dict[extra_stat])
+                    stacked_bar_series.append(bar_set)
+
+            chart.addSeries(stacked_bar_series)
+
+            x_axis = QtChart.QBarCategoryAxis()
+            x_axis.append(categories)
+            x_axis.setLabelsAngle(label_angle)
+            if show_host_names:
+                x_axis.setTitleText("Host: Date (Type)")
+            else:
+                x_axis.setTitleText("Date (Type)")
+            title_font = x_axis.titleFont()
+            title_font.setPointSize(font_size)
+            x_axis.setTitleFont(title_font)
+            labels_font = x_axis.labelsFont()
+            labels_font.setPointSize(font_size * 0.75)
+            x_axis.setLabelsFont(labels_font)
+            chart.addAxis(x_axis, QtCore.Qt.AlignBottom)
+            stacked_bar_series.attachAxis(x_axis)
+
+            y_axis = QtChart.QValueAxis()
+            if divide_by_ps:
+                y_axis.setTitleText("Time per pixel sample (seconds)")
+            elif show_pixel_samples:
+                y_axis.setTitleText("Pixel Samples (millions)")
+            elif show_memory:
+                y_axis.setTitleText("Memory (GB)")
+            else:
+                y_axis.setTitleText("Time (seconds)")
+            labels_font = y_axis.labelsFont()
+            labels_font.setPointSize(font_size)
+            y_axis.setLabelsFont(labels_font)
+            title_font = y_axis.titleFont()
+            title_font.setPointSize(font_size)
+            y_axis.setTitleFont(title_font)
+            chart.addAxis(y_axis, QtCore.Qt.AlignLeft)
+            stacked_bar_series.attachAxis(y_axis)
+
+            if not resize:
+                # Set the saved size
+                y_axis.setMax(self.max_y)
+            self.max_y = y_axis.max()
+
+            chart.legend().setVisible(False)
+
+            if show_line_series:
+                self.add_line_series(chart,
+                                     x_axis,
+                                     y_axis,
+                                     stats_dict,
+                                     type_visibility_list)
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+# noinspection PyUnresolvedReferences
+class StatsModel(QtCore.QAbstractListModel):
+
+    # Emitted when the user checks or unchecks a stat in the view
+    stats_toggled = QtCore.pyqtSignal()
+
+    CategoryRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, stat_colors, parent=None):
+        super().__init__(parent)
+
+        self.stat_colors = stat_colors
+
+        # Each row is [category, stat, checked, enabled], stat is None for the
+        # header row of a category
+        self.rows = list()
+        self.stat_rows = dict()
+
+        self.header_font = QtGui.QFont()
+        self.header_font.setBold(True)
+
+    def add_stats(self, categories):
+        # categories is a list of (category, stats, checked). Each category goes above the
+        # previous ones with its stats reversed, so the list reads from the top of the
+        # stacked bars down
+        new_rows = list()
+        for category, stats, checked in reversed(categories):
+            new_rows.append([category, None, False, True])
+            new_rows += [[category, stat, checked, True] for stat in reversed(stats)]
+        self.beginInsertRows(QtCore.QModelIndex(), 0, len(new_rows) - 1)
+        self.rows[0:0] = new_rows
+        # The stat index is rebuilt once for all the categories
+        self.stat_rows = {row[1]: i for i, row in enumerate(self.rows) if row[1] is not None}
+        self.endInsertRows()
+
+    def stats(self):
+        return list(self.stat_rows)
+
+    def checked_stats(self):
+        return [row[1] for row in self.rows if row[1] is not None and row[2]]
+
+    def set_checked(self, stats, checked):
+        self.update_rows(stats, 2, checked)
+
+    def set_enabled(self, stats, enabled):
+        self.update_rows(stats, 3, enabled)
+
+    def update_rows(self, stats, column, value):
+        # A single dataChanged covers all the rows that were updated
+        row_indices = [self.stat_rows[stat] for stat in stats]
+        for row_index in row_indices:
+            self.rows[row_index][column] = value
+        if row_indices:
+            self.dataChanged.emit(self.index(min(row_indices)), self.index(max(row_indices)))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        category, stat, checked, enabled = self.rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return category if stat is None else stat
+        if role == self.CategoryRole:
+            return category
+        if stat is None:
+            if role == QtCore.Qt.FontRole:
+                return self.header_font
+            return None
+        if role == QtCore.Qt.CheckStateRole:
+            return QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+        if role == QtCore.Qt.DecorationRole:
+            return self.stat_colors.get(stat)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        category, stat, checked, enabled = self.rows[index.row()]
+        if stat is None:
+            return QtCore.Qt.ItemIsEnabled
+        if not enabled:
+            return QtCore.Qt.ItemIsUserCheckable
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.CheckStateRole or not index.isValid():
+            return False
+
+        row = self.rows[index.row()]
+        if row[1] is None:
+            return False
+
+        row[2] = value == QtCore.Qt.Checked
+        self.dataChanged.emit(index, index, [role])
+        self.stats_toggled.emit()
+        return True
+
+
+# noinspection PyUnresolvedReferences
+class LogsModel(QtCore.QAbstractListModel):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Each row is a dict with the "name" and "path" of a log file
+        self.rows = list()
+        self.show_full_paths = False
+
+    def set_logs(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def set_show_full_paths(self, show_full_paths):
+        # Every row switches between name and path with a single dataChanged
+        if show_full_paths == self.show_full_paths:
+            return
+        self.show_full_paths = show_full_paths
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [QtCore.Qt.DisplayRole])
+
+    def set_name(self, row, name):
+        self.rows[row]["name"] = name
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self.rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return row["path"] if self.show_full_paths else row["name"]
+        if role == QtCore.Qt.ToolTipRole:
+            return row["path"]
+        if role == QtCore.Qt.UserRole:
+            return row
+        return None
 
 
 # noinspection PyUnresolvedReferences
@@ -615,20 +874,25 @@ class MyWindow(QtWidgets.QMainWindow):
         self.setGeometry(200, 200, 1700, 800)
 
         # TODO Remove these hard coded directories - ask user on first run
-        self.profile_directory = "/rel/ci_builds/Moonbase/ProfileRuns/latest_results/profile_reports"
+        self.profile_directory = DEFAULT_PROFILE_DIRECTORY
         self.process_weeks = True
 
         self.work_directory = os.path.join(os.environ["HOME"], "render_profile_viewer")
-        if not os.path.exists(self.work_directory):
-            os.makedirs(self.work_directory)
-
         self.converted_images_directory = os.path.join(self.work_directory, 'converted_images')
-        if not os.path.exists(self.converted_images_directory):
-            os.makedirs(self.converted_images_directory)
+        os.makedirs(self.converted_images_directory, exist_ok=True)
 
         self.cache_directory = os.path.join(self.work_directory, "cache")
-        if not os.path.exists(self.cache_directory):
-            os.makedirs(self.cache_directory)
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        # Cache directories being deleted in the background
+        self.cache_removals = set()
+
+        # Profile directories being scanned for tests, log files being scanned and logs being read
+        # in the background
+        self.test_scans = set()
+        self.current_test_scan = None
+        self.log_scans = set()
+        self.log_reads = set()
 
         if self.log_file_mode:
             self.use_cache = False
@@ -640,9 +904,26 @@ class MyWindow(QtWidgets.QMainWindow):
 
         self.setWindowTitle(f"Render Profile Viewer {__version__} -- (Profile directory: {self.profile_directory})")
 
+        # Loaded pixmaps keyed by (path, mtime), least recently used first
+        self.images_cache = collections.OrderedDict()
+        self.images_cache_bytes = 0
+        self.scaled_images_cache = collections.OrderedDict()
+        self.log_stats_cache = collections.OrderedDict()
+        # Worker processes parsing logs in parallel, started on first use
+        self.log_parser_pool = None
+        self.test_dir_scans = dict()
+
         # Stats filled in clicked_weeks_list and passed to RenderProfileChartView
         self.stats = dict()
 
+        # Chart updates requested by the controls and the selections are coalesced
+        # into a single rebuild once the current burst of signals has been handled
+        self.update_timer = QtCore.QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(0)
+        self.update_timer.timeout.connect(self.scheduled_update)
+        self.pending_resize = False
+
         central_widget = QtWidgets.QWidget()
         self.setCentralWidget(central_widget)
 
@@ -708,50 +989,52 @@ class MyWindow(QtWidgets.QMainWindow):
 
         # Theme
         self.use_dark_theme = True
+        self.theme = None
+        self.theme_palettes = dict()
 
         # Log List
         if self.log_file_mode:
             logs_list_widget = QtWidgets.QWidget()
-            logs_list_widget.setLayout(QtWidgets.QVBoxLayout())
-            logs_list_label = QtWidgets.QLabel("Logs")
-            logs_list_widget.layout().addWidget(logs_list_label)
+            logs_list_layout = QtWidgets.QVBoxLayout(logs_list_widget)
+            logs_list_layout.addWidget(QtWidgets.QLabel("Logs"))
             self.show_full_paths_checkbox = QtWidgets.QCheckBox("Show full paths")
             self.show_full_paths_checkbox.stateChanged.connect(self.checkbox_changed_full_paths)
-            logs_list_widget.layout().addWidget(self.show_full_paths_checkbox)
-            self.logs_list = QtWidgets.QListWidget()
+            logs_list_layout.addWidget(self.show_full_paths_checkbox)
+            self.logs_model = LogsModel(self)
+            self.logs_list = QtWidgets.QListView()
+            self.logs_list.setUniformItemSizes(True)
             self.logs_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-            logs_list_widget.layout().addWidget(self.logs_list)
-            self.logs_list.itemSelectionChanged.connect(self.selection_changed_logs)
+            self.logs_list.setModel(self.logs_model)
+            logs_list_layout.addWidget(self.logs_list)
+            self.logs_list.selectionModel().selectionChanged.connect(self.selection_changed_logs)
             main_h_splitter.addWidget(logs_list_widget)
             self.populate_logs_list()
             self.logs_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
             self.logs_list.customContextMenuRequested.connect(self.log_list_context_menu)
         else:
             tests_weeks_widget = QtWidgets.QWidget()
-            tests_weeks_widget.setLayout(QtWidgets.QVBoxLayout())
+            tests_weeks_layout = QtWidgets.QVBoxLayout(tests_weeks_widget)
             tests_weeks_v_splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
             tests_weeks_v_splitter.setHandleWidth(10)
-            tests_weeks_widget.layout().addWidget(tests_weeks_v_splitter)
+            tests_weeks_layout.addWidget(tests_weeks_v_splitter)
             main_h_splitter.addWidget(tests_weeks_widget)
 
             # Test List
             tests_list_widget = QtWidgets.QWidget()
-            tests_list_widget.setLayout(QtWidgets.QVBoxLayout())
-            tests_list_label = QtWidgets.QLabel("Tests")
-            tests_list_widget.layout().addWidget(tests_list_label)
+            tests_list_layout = QtWidgets.QVBoxLayout(tests_list_widget)
+            tests_list_layout.addWidget(QtWidgets.QLabel("Tests"))
             self.tests_list = QtWidgets.QListWidget()
-            tests_list_widget.layout().addWidget(self.tests_list)
+            tests_list_layout.addWidget(self.tests_list)
             self.tests_list.itemSelectionChanged.connect(self.selection_changed_tests)
             tests_weeks_v_splitter.addWidget(tests_list_widget)
             self.populate_test_list()
 
             # Weeks List
             weeks_list_widget = QtWidgets.QWidget()
-            weeks_list_widget.setLayout(QtWidgets.QVBoxLayout())
-            weeks_list_label = QtWidgets.QLabel("Weeks")
-            weeks_list_widget.layout().addWidget(weeks_list_label)
+            weeks_list_layout = QtWidgets.QVBoxLayout(weeks_list_widget)
+            weeks_list_layout.addWidget(QtWidgets.QLabel("Weeks"))
             self.weeks_list = QtWidgets.QListWidget()
-            weeks_list_widget.layout().addWidget(self.weeks_list)
+            weeks_list_layout.addWidget(self.weeks_list)
             self.weeks_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
             self.weeks_list.itemSelectionChanged.connect(self.selection_changed_weeks)
             tests_weeks_v_splitter.addWidget(weeks_list_widget)
@@ -762,298 +1045,227 @@ class MyWindow(QtWidgets.QMainWindow):
         main_h_splitter.addWidget(self.chart_image_log_tab_widget)
 
         # Create chart
-        self.render_profile_chart = RenderProfileChartView()
-        self.render_profile_chart.stat_signal.connect(self.statusBar().showMessage)
+        render_profile_chart = RenderProfileChartView()
+        self.render_profile_chart = render_profile_chart
+        render_profile_chart.stat_signal.connect(self.statusBar().showMessage)
 
         self.chart_label_angle = 90
 
-        # Chart Stats Checkboxes and Buttons
+        # Chart Stats List, Category Checkboxes and Buttons
         chart_stats_widget = QtWidgets.QWidget()
-        chart_stats_widget.setLayout(QtWidgets.QVBoxLayout())
-        chart_stats_widget.layout().setDirection(QtWidgets.QBoxLayout.BottomToTop)
+        chart_stats_layout = QtWidgets.QVBoxLayout(chart_stats_widget)
         chart_stats_widget.setFixedWidth(225)
-        chart_stats_widget.setFixedHeight(900)
         chart_stats_widget.setAutoFillBackground(True)
-        chart_stats_widget.layout().setSpacing(0)
-        chart_stats_widget.layout().addStretch()
+        chart_stats_layout.setSpacing(0)
+        # The height of a blank line of text at the default font size
+        chart_stats_group_spacing = 13
 
-        self.chart_stats_checkboxes = dict()
-
-        # Pixel samples stats
-        self.show_pixel_samples_checkbox = QtWidgets.QCheckBox("Show/Hide Pixel Samples")
-        self.show_pixel_samples_checkbox.setChecked(False)
-        self.show_pixel_samples_checkbox.stateChanged.connect(self.show_pixel_samples)
-        chart_stats_widget.layout().addWidget(self.show_pixel_samples_checkbox)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel(""))
+        show_all_button = QtWidgets.QPushButton("Show All")
+        show_all_button.clicked.connect(self.show_all_stats)
+        chart_stats_layout.addWidget(show_all_button)
 
-        # Memory stats
-        for stat in self.render_profile_chart.memory_stats:
-            self.add_stat_checkbox(stat, chart_stats_widget, False)
-        self.show_memory_checkbox = QtWidgets.QCheckBox("Show/Hide Memory Stats")
-        self.show_memory_checkbox.setChecked(False)
-        self.show_memory_checkbox.stateChanged.connect(self.show_memory)
-        chart_stats_widget.layout().addWidget(self.show_memory_checkbox)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel("Memory Stats"))
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel(""))
+        hide_all_button = QtWidgets.QPushButton("Hide All")
+        hide_all_button.clicked.connect(self.hide_all_stats)
+        chart_stats_layout.addWidget(hide_all_button)
+        chart_stats_layout.addSpacing(chart_stats_group_spacing)
 
-        # Render prep stats
-        for stat in self.render_profile_chart.render_prep_stats:
-            self.add_stat_checkbox(stat, chart_stats_widget, False)
-        self.show_hide_render_prep_checkbox = QtWidgets.QCheckBox("Show/Hide Render Prep Stats")
-        self.show_hide_render_prep_checkbox.setChecked(False)
-        self.show_hide_render_prep_checkbox.stateChanged.connect(self.show_hide_render_prep_stats)
-        chart_stats_widget.layout().addWidget(self.show_hide_render_prep_checkbox)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel("Render Prep Stats"))
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel(""))
+        self.show_hide_vector_checkbox = QtWidgets.QCheckBox("Show/Hide Vector Stats")
+        self.show_hide_vector_checkbox.setChecked(True)
+        self.show_hide_vector_checkbox.stateChanged.connect(self.show_hide_vector_stats)
+        chart_stats_layout.addWidget(self.show_hide_vector_checkbox)
 
-        # Scalar stats
-        for stat in self.render_profile_chart.scalar_stats:
-            self.add_stat_checkbox(stat, chart_stats_widget)
         self.show_hide_scalar_checkbox = QtWidgets.QCheckBox("Show/Hide Scalar Stats")
         self.show_hide_scalar_checkbox.setChecked(True)
         self.show_hide_scalar_checkbox.stateChanged.connect(self.show_hide_scalar_stats)
-        chart_stats_widget.layout().addWidget(self.show_hide_scalar_checkbox)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel("Scalar Stats"))
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel(""))
+        chart_stats_layout.addWidget(self.show_hide_scalar_checkbox)
 
-        # Vector stats
-        for stat in self.render_profile_chart.vector_stats:
-            self.add_stat_checkbox(stat, chart_stats_widget)
-        self.show_hide_vector_checkbox = QtWidgets.QCheckBox("Show/Hide Vector Stats")
-        self.show_hide_vector_checkbox.setChecked(True)
-        self.show_hide_vector_checkbox.stateChanged.connect(self.show_hide_vector_stats)
-        chart_stats_widget.layout().addWidget(self.show_hide_vector_checkbox)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel("Vector Stats"))
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel(""))
-
-        # XPU stats
-        for stat in self.render_profile_chart.xpu_stats:
-            self.add_stat_checkbox(stat, chart_stats_widget)
-        chart_stats_widget.layout().addWidget(QtWidgets.QLabel("XPU Stats"))
+        self.show_hide_render_prep_checkbox = QtWidgets.QCheckBox("Show/Hide Render Prep Stats")
+        self.show_hide_render_prep_checkbox.setChecked(False)
+        self.show_hide_render_prep_checkbox.stateChanged.connect(self.show_hide_render_prep_stats)
+        chart_stats_layout.addWidget(self.show_hide_render_prep_checkbox)
 
-        hide_all_button = QtWidgets.QPushButton("Hide All")
-        hide_all_button.pressed.connect(self.hide_all_stats)
-        chart_stats_widget.layout().addWidget(hide_all_button)
+        self.show_memory_checkbox = QtWidgets.QCheckBox("Show/Hide Memory Stats")
+        self.show_memory_checkbox.setChecked(False)
+        self.show_memory_checkbox.stateChanged.connect(self.show_memory)
+        chart_stats_layout.addWidget(self.show_memory_checkbox)
 
-        show_all_button = QtWidgets.QPushButton("Show All")
-        show_all_button.pressed.connect(self.show_all_stats)
-        chart_stats_widget.layout().addWidget(show_all_button)
+        # Pixel samples stats
+        self.show_pixel_samples_checkbox = QtWidgets.QCheckBox("Show/Hide Pixel Samples")
+        self.show_pixel_samples_checkbox.setChecked(False)
+        self.show_pixel_samples_checkbox.stateChanged.connect(self.show_pixel_samples)
+        chart_stats_layout.addWidget(self.show_pixel_samples_checkbox)
+        chart_stats_layout.addSpacing(chart_stats_group_spacing)
+
+        # The individual stats are rows of a single checkable list view
+        self.stats_model = StatsModel(render_profile_chart.stat_colors, self)
+        self.stats_model.add_stats([("Memory Stats", render_profile_chart.memory_stats, False),
+                                    ("Render Prep Stats", render_profile_chart.render_prep_stats, False),
+                                    ("Scalar Stats", render_profile_chart.scalar_stats, True),
+                                    ("Vector Stats", render_profile_chart.vector_stats, True),
+                                    ("XPU Stats", render_profile_chart.xpu_stats, True)])
+
+        self.stats_model.stats_toggled.connect(self.schedule_update)
+
+        stats_list_view = QtWidgets.QListView()
+        stats_list_view.setUniformItemSizes(True)
+        stats_list_view.setIconSize(QtCore.QSize(12, 12))
+        stats_list_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        stats_list_view.setModel(self.stats_model)
+        chart_stats_layout.addWidget(stats_list_view)
 
         chart_v_splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
 
         # Chart Tab
         chart_v_widget = QtWidgets.QWidget()
-        chart_v_widget.setLayout(QtWidgets.QVBoxLayout())
+        chart_v_layout = QtWidgets.QVBoxLayout(chart_v_widget)
         chart_v_splitter.addWidget(chart_v_widget)
         self.chart_image_log_tab_widget.addTab(chart_v_splitter, "Chart")
 
         chart_stats_h_splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
-        chart_v_widget.layout().addWidget(chart_stats_h_splitter)
+        chart_v_layout.addWidget(chart_stats_h_splitter)
         chart_stats_h_splitter.setHandleWidth(10)
 
-        chart_stats_scroll_area = QtWidgets.QScrollArea()
-        chart_stats_scroll_area.setWidget(chart_stats_widget)
-        chart_stats_h_splitter.addWidget(chart_stats_scroll_area)
+        chart_stats_h_splitter.addWidget(chart_stats_widget)
 
         chart_stats_h_splitter.addWidget(self.render_profile_chart)
         chart_stats_h_splitter.setSizes([175, 800])
 
-        # Image Tab
-        self.image_tab_widget = QtWidgets.QTabWidget()
-        self.chart_image_log_tab_widget.addTab(self.image_tab_widget, "Image")
-
-        self.generic_image_widget = QtWidgets.QWidget()
-        self.image_tab_widget.addTab(self.generic_image_widget, "Generic Image")
-
-        self.generic_image_widget.setLayout(QtWidgets.QVBoxLayout())
-
-        # Image error messages
-        self.image_error_message = QtWidgets.QLabel("")
-        self.image_error_message.setStyleSheet(f"color: rgb(255, 0, 0); font-size: 20px;")
-        self.generic_image_widget.layout().addWidget(self.image_error_message)
-
-        # Image Label
-        self.image_label = QtWidgets.QLabel("")
-        self.generic_image_widget.layout().addWidget(self.image_label)
-
-        if not self.log_file_mode:
-            image_warning_label2 = QtWidgets.QLabel("Warning, the image above is generic for the test "
-                                                    "and does not represent the selected weeks or log files.")
-            self.generic_image_widget.layout().addWidget(image_warning_label2)
-            image_warning_label3 = QtWidgets.QLabel("Press the buttons below to show or convert the actual images.")
-            self.generic_image_widget.layout().addWidget(image_warning_label3)
-
-        # Show images button
-        if self.log_file_mode:
-            self.show_images_button = QtWidgets.QPushButton("Show images for selected logs with r_view")
-        else:
-            self.show_images_button = QtWidgets.QPushButton("Show images for selected weeks with r_view")
-        self.show_images_button.setFixedWidth(250)
-        self.show_images_button.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
-        self.show_images_button.pressed.connect(self.show_selected_images)
-        self.generic_image_widget.layout().addWidget(self.show_images_button)
-
-        # Convert images button
-        if self.log_file_mode:
-            self.convert_images_button = QtWidgets.QPushButton("Convert images for selected logs")
-        else:
-            self.convert_images_button = QtWidgets.QPushButton("Convert images for selected weeks")
-
-        self.convert_images_button.setFixedWidth(250)
-        self.convert_images_button.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
-        self.convert_images_button.pressed.connect(self.convert_selected_images)
-        self.generic_image_widget.layout().addWidget(self.convert_images_button)
-
-        self.generic_image_widget.layout().addStretch()
+        # Image and Logs tabs, their contents are built the first time they are shown
+        self.image_tab_widget = None
+        self.generic_image_path = None
+        self.converting_images = False
+        self.images_tab = QtWidgets.QWidget()
+        images_layout = QtWidgets.QVBoxLayout(self.images_tab)
+        images_layout.setContentsMargins(0, 0, 0, 0)
+        self.chart_image_log_tab_widget.addTab(self.images_tab, "Image")
 
-        # Logs Tab
-        logs_widget = QtWidgets.QWidget()
-        logs_widget.setLayout(QtWidgets.QVBoxLayout())
-        logs_widget.layout().addWidget(QtWidgets.QLabel("Select a week to display log files"))
-        self.chart_image_log_tab_widget.addTab(logs_widget, "Logs")
-
-        self.log_tab_widget = QtWidgets.QTabWidget()
-        logs_widget.layout().addWidget(self.log_tab_widget)
+        self.log_tab_widget = None
+        self.logs_tab = QtWidgets.QWidget()
+        self.logs_tab.setLayout(QtWidgets.QVBoxLayout())
+        self.chart_image_log_tab_widget.addTab(self.logs_tab, "Logs")
 
         # Bottom Scalar, Vector, and XPU Checkboxes and Resize
         chart_bottom_widget = QtWidgets.QWidget()
-        chart_bottom_widget.setLayout(QtWidgets.QHBoxLayout())
+        chart_bottom_layout = QtWidgets.QHBoxLayout(chart_bottom_widget)
         chart_v_splitter.addWidget(chart_bottom_widget)
 
         group_box_height = 100
 
         # Test Types
         test_type_group_box = QtWidgets.QGroupBox()
-        test_type_group_box.setLayout(QtWidgets.QHBoxLayout())
+        test_type_layout = QtWidgets.QHBoxLayout(test_type_group_box)
         test_type_group_box.setFixedHeight(group_box_height)
         test_type_group_box.setTitle("Test Types")
-        chart_bottom_widget.layout().addWidget(test_type_group_box)
-
-        self.scalar_checkbox = QtWidgets.QCheckBox("scalar")
-        self.scalar_checkbox.setChecked(True)
-        if self.log_file_mode:
-            self.scalar_checkbox.stateChanged.connect(self.selection_changed_logs)
-        else:
-            self.scalar_checkbox.stateChanged.connect(self.selection_changed_weeks)
-        test_type_group_box.layout().addWidget(self.scalar_checkbox)
-
-        self.vector_checkbox = QtWidgets.QCheckBox("vector")
-        self.vector_checkbox.setChecked(True)
-        if self.log_file_mode:
-            self.vector_checkbox.stateChanged.connect(self.selection_changed_logs)
-        else:
-            self.vector_checkbox.stateChanged.connect(self.selection_changed_weeks)
-        test_type_group_box.layout().addWidget(self.vector_checkbox)
+        chart_bottom_layout.addWidget(test_type_group_box)
 
-        self.xpu_checkbox = QtWidgets.QCheckBox("xpu")
-        self.xpu_checkbox.setChecked(True)
         if self.log_file_mode:
-            self.xpu_checkbox.stateChanged.connect(self.selection_changed_logs)
+            type_selection_changed = self.selection_changed_logs
         else:
-            self.xpu_checkbox.stateChanged.connect(self.selection_changed_weeks)
-        test_type_group_box.layout().addWidget(self.xpu_checkbox)
+            type_selection_changed = self.selection_changed_weeks
+        self.type_checkboxes = dict()
+        for test_type in ['scalar', 'vector', 'xpu']:
+            type_checkbox = QtWidgets.QCheckBox(test_type)
+            type_checkbox.setChecked(True)
+            type_checkbox.stateChanged.connect(type_selection_changed)
+            test_type_layout.addWidget(type_checkbox)
+            self.type_checkboxes[test_type] = type_checkbox
+        self.scalar_checkbox = self.type_checkboxes['scalar']
+        self.vector_checkbox = self.type_checkboxes['vector']
+        self.xpu_checkbox = self.type_checkboxes['xpu']
 
         # Host Filter
         host_filter_group_box = QtWidgets.QGroupBox()
-        host_filter_group_box.setLayout(QtWidgets.QVBoxLayout())
+        host_filter_layout = QtWidgets.QVBoxLayout(host_filter_group_box)
         host_filter_group_box.setFixedHeight(group_box_height)
         host_filter_group_box.setTitle("Host Filter")
-        chart_bottom_widget.layout().addWidget(host_filter_group_box)
+        chart_bottom_layout.addWidget(host_filter_group_box)
 
         self.host_filter_line_edit = QtWidgets.QLineEdit()
         self.host_filter_line_edit.setToolTip("List of space separated host prefixes "
                                               "to filter by (i.e. \"ws p920 tin\"")
-        self.host_filter_line_edit.editingFinished.connect(self.update_chart)
-        host_filter_group_box.layout().addWidget(self.host_filter_line_edit)
+        self.host_filter_line_edit.editingFinished.connect(self.schedule_update)
+        host_filter_layout.addWidget(self.host_filter_line_edit)
 
         self.show_hosts_in_chart_checkbox = QtWidgets.QCheckBox("Show host names in chart")
         self.show_hosts_in_chart_checkbox.setToolTip("Show the names of the hosts instead of dates/types in the chart")
         self.show_hosts_in_chart_checkbox.setChecked(False)
-        self.show_hosts_in_chart_checkbox.stateChanged.connect(self.update_chart)
-        host_filter_group_box.layout().addWidget(self.show_hosts_in_chart_checkbox)
+        self.show_hosts_in_chart_checkbox.stateChanged.connect(self.schedule_update)
+        host_filter_layout.addWidget(self.show_hosts_in_chart_checkbox)
 
         # Options
         options_group_box = QtWidgets.QGroupBox()
-        options_group_box.setLayout(QtWidgets.QVBoxLayout())
-        options_group_box.layout().setSpacing(0)
+        options_layout = QtWidgets.QVBoxLayout(options_group_box)
+        options_layout.setSpacing(0)
         options_group_box.setTitle("Options")
-        chart_bottom_widget.layout().addWidget(options_group_box)
+        chart_bottom_layout.addWidget(options_group_box)
         options_group_box.setFixedHeight(group_box_height)
 
         self.divide_by_ps_checkbox = QtWidgets.QCheckBox("Divide by Pixel Samples")
         self.divide_by_ps_checkbox.setChecked(False)
-        self.divide_by_ps_checkbox.stateChanged.connect(lambda: self.update_chart(resize=True))
-        options_group_box.layout().addWidget(self.divide_by_ps_checkbox)
+        self.divide_by_ps_checkbox.stateChanged.connect(lambda: self.schedule_update(resize=True))
+        options_layout.addWidget(self.divide_by_ps_checkbox)
 
         self.show_trend_lines_checkbox = QtWidgets.QCheckBox("Show Trend Lines")
         self.show_trend_lines_checkbox.setChecked(True)
-        self.show_trend_lines_checkbox.stateChanged.connect(lambda: self.update_chart(resize=True))
-        options_group_box.layout().addWidget(self.show_trend_lines_checkbox)
+        self.show_trend_lines_checkbox.stateChanged.connect(lambda: self.schedule_update(resize=True))
+        options_layout.addWidget(self.show_trend_lines_checkbox)
 
         self.show_fallback_checkbox = QtWidgets.QCheckBox("Show Fallback")
-        pal = QtGui.QPalette()
-        pal.setColor(QtGui.QPalette.Base, self.render_profile_chart.fallback_color)
-        self.show_fallback_checkbox.setPalette(pal)
+        self.show_fallback_checkbox.setPalette(get_base_palette(render_profile_chart.fallback_color.rgba()))
         self.show_fallback_checkbox.setChecked(True)
-        self.show_fallback_checkbox.stateChanged.connect(lambda: self.update_chart(resize=True))
-        options_group_box.layout().addWidget(self.show_fallback_checkbox)
+        self.show_fallback_checkbox.stateChanged.connect(lambda: self.schedule_update(resize=True))
+        options_layout.addWidget(self.show_fallback_checkbox)
 
         self.show_crash_checkbox = QtWidgets.QCheckBox("Show Crash")
-        pal = QtGui.QPalette()
-        pal.setColor(QtGui.QPalette.Base, self.render_profile_chart.crash_color)
-        self.show_crash_checkbox.setPalette(pal)
+        self.show_crash_checkbox.setPalette(get_base_palette(render_profile_chart.crash_color.rgba()))
         self.show_crash_checkbox.setChecked(True)
-        self.show_crash_checkbox.stateChanged.connect(lambda: self.update_chart(resize=True))
-        options_group_box.layout().addWidget(self.show_crash_checkbox)
+        self.show_crash_checkbox.stateChanged.connect(lambda: self.schedule_update(resize=True))
+        options_layout.addWidget(self.show_crash_checkbox)
 
-        options_group_box.layout().addStretch()
+        options_layout.addStretch()
 
         # Bottom Performance Thresholds
         performance_thresholds_group_box = QtWidgets.QGroupBox()
-        performance_thresholds_group_box.setLayout(QtWidgets.QHBoxLayout())
-        performance_thresholds_group_box.layout().setDirection(QtWidgets.QBoxLayout.RightToLeft)
+        performance_thresholds_layout = QtWidgets.QHBoxLayout(performance_thresholds_group_box)
+        performance_thresholds_layout.setDirection(QtWidgets.QBoxLayout.RightToLeft)
         performance_thresholds_group_box.setTitle("Performance Thresholds")
         performance_thresholds_group_box.setFixedHeight(group_box_height)
-        chart_bottom_widget.layout().addWidget(performance_thresholds_group_box)
+        chart_bottom_layout.addWidget(performance_thresholds_group_box)
 
         self.improvement_warning_checkbox = QtWidgets.QCheckBox("Show Improvements")
-        pal = QtGui.QPalette()
-        pal.setColor(QtGui.QPalette.Base, self.render_profile_chart.improvements_color)
-        self.improvement_warning_checkbox.setPalette(pal)
+        self.improvement_warning_checkbox.setPalette(get_base_palette(render_profile_chart.improvements_color.rgba()))
         self.improvement_warning_checkbox.setChecked(False)
         self.improvement_warning_checkbox.stateChanged.connect(self.checkbox_changed_improvements)
         self.improvement_warning_checkbox.setToolTip("Highlight stats that have improved more than this "
                                                      " percentage from the previous week in green")
-        performance_thresholds_group_box.layout().addWidget(self.improvement_warning_checkbox)
+        performance_thresholds_layout.addWidget(self.improvement_warning_checkbox)
 
         self.improvement_warning_spin_box = QtWidgets.QSpinBox()
         self.improvement_warning_spin_box.setMinimum(0)
         self.improvement_warning_spin_box.setMaximum(100)
         self.improvement_warning_spin_box.setValue(10)
         self.improvement_warning_spin_box.setEnabled(False)
-        self.improvement_warning_spin_box.valueChanged.connect(self.update_chart)
+        self.improvement_warning_spin_box.valueChanged.connect(self.schedule_update)
         self.improvement_warning_spin_box.setToolTip("Highlight stats that have improved more than this "
                                                      " percentage from the previous week in green")
-        performance_thresholds_group_box.layout().addWidget(self.improvement_warning_spin_box)
+        performance_thresholds_layout.addWidget(self.improvement_warning_spin_box)
 
         self.regression_warning_checkbox = QtWidgets.QCheckBox("Show Regressions")
-        pal = QtGui.QPalette()
-        pal.setColor(QtGui.QPalette.Base, self.render_profile_chart.regression_color)
-        self.regression_warning_checkbox.setPalette(pal)
+        self.regression_warning_checkbox.setPalette(get_base_palette(render_profile_chart.regression_color.rgba()))
         self.regression_warning_checkbox.setChecked(False)
         self.regression_warning_checkbox.stateChanged.connect(self.checkbox_changed_regressions)
         self.regression_warning_checkbox.setToolTip("Highlight stats that have regressed more than this "
                                                     " percentage from the previous week in red")
-        performance_thresholds_group_box.layout().addWidget(self.regression_warning_checkbox)
+        performance_thresholds_layout.addWidget(self.regression_warning_checkbox)
         self.regression_warning_spin_box = QtWidgets.QSpinBox()
         self.regression_warning_spin_box.setMinimum(0)
         self.regression_warning_spin_box.setMaximum(100)
         self.regression_warning_spin_box.setValue(10)
         self.regression_warning_spin_box.setEnabled(False)
-        self.regression_warning_spin_box.valueChanged.connect(self.update_chart)
+        self.regression_warning_spin_box.valueChanged.connect(self.schedule_update)
         self.regression_warning_spin_box.setToolTip("Highlight stats that have regressed more than this "
                                                     " percentage from the previous week in red")
-        performance_thresholds_group_box.layout().addWidget(self.regression_warning_spin_box)
+        performance_thresholds_layout.addWidget(self.regression_warning_spin_box)
 
         # Font Size
         self.font_size = 11
@@ -1061,60 +1273,45 @@ class MyWindow(QtWidgets.QMainWindow):
         # Bottom View Controls
         view_group_box = QtWidgets.QGroupBox()
         view_group_box.setFixedHeight(group_box_height)
-        view_group_box.setLayout(QtWidgets.QHBoxLayout())
+        view_layout = QtWidgets.QHBoxLayout(view_group_box)
 
         view_group_box.setTitle("View")
         view_group_box.setToolTip("Use the buttons or press 'wasd' to scroll,"
                                   "'q' to zoom out, 'e' to zoom in, and 'r' to home")
-        chart_bottom_widget.layout().addWidget(view_group_box)
+        chart_bottom_layout.addWidget(view_group_box)
 
         resize_button = QtWidgets.QPushButton("Refit Chart")
         resize_button.setToolTip("Reset the view to fit the current chart - can also press 'Home' or 'r'")
         resize_button.setFixedWidth(100)
-        resize_button.pressed.connect(lambda: self.update_chart(resize=True))
-        view_group_box.layout().addWidget(resize_button)
+        resize_button.clicked.connect(lambda: self.schedule_update(resize=True))
+        view_layout.addWidget(resize_button)
 
-        chart_bottom_widget.layout().addStretch()
+        chart_bottom_layout.addStretch()
 
         main_h_splitter.setSizes([250, 1350])
 
-        self.chart_image_log_tab_widget.currentChanged.connect(self.resize_image)
+        self.chart_image_log_tab_widget.currentChanged.connect(self.tab_changed)
 
         self.show()
 
         # Set initial dark theme
-        app = QtWidgets.QApplication.instance()
-        palette = app.palette()
-        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(50, 50, 50))
-        palette.setColor(QtGui.QPalette.Button, QtGui.QColor(70, 70, 70))
-        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.Text, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(70, 70, 70))
-        app.setPalette(palette)
-        self.setStyleSheet(f'font-size: {self.font_size}px')
+        self.set_theme_palette("dark")
+        self.set_font_stylesheet()
 
-        if self.log_file_mode:
-            self.logs_list.setCurrentRow(0)
-        else:
-            # Select first row and show chars
-            self.tests_list.setCurrentRow(0)
-            self.selection_changed_tests()
-            self.weeks_list.selectAll()
+        # The first test or log is selected, and the chart built, once the tests or logs list has been scanned
 
     def log_list_context_menu(self, position):
         pop_menu = QtWidgets.QMenu()
 
-        if self.logs_list.itemAt(position):
+        if self.logs_list.indexAt(position).isValid():
             set_test_name_action = QtWidgets.QAction("Set test name")
             set_test_name_action.triggered.connect(self.set_custom_log_name)
             pop_menu.addAction(set_test_name_action)
             pop_menu.exec_(self.logs_list.mapToGlobal(position))
 
     def set_custom_log_name(self):
-        selected_item = self.logs_list.selectedItems()[0]
-        user_role_dict = selected_item.data(QtCore.Qt.UserRole)
-        test_name = user_role_dict["name"]
+        selected_index = self.logs_list.selectionModel().selectedRows()[0]
+        test_name = selected_index.data(QtCore.Qt.UserRole)["name"]
 
         new_test_name, ok = QtWidgets.QInputDialog.getText(self,
                                                            "Set test name",
@@ -1123,9 +1320,7 @@ class MyWindow(QtWidgets.QMainWindow):
                                                            test_name)
 
         if ok:
-            selected_item.setText(new_test_name)
-            user_role_dict["name"] = new_test_name
-            selected_item.setData(QtCore.Qt.UserRole, user_role_dict)
+            self.logs_model.set_name(selected_index.row(), new_test_name)
             self.selection_changed_logs()
 
     # noinspection PyTypeChecker
@@ -1139,10 +1334,6 @@ class MyWindow(QtWidgets.QMainWindow):
         self.setWindowTitle(f"Render Profile Viewer {__version__} -- (Profile directory: {self.profile_directory})")
 
         self.populate_test_list()
-        self.tests_list.setCurrentRow(0)
-        self.selection_changed_tests()
-        self.weeks_list.selectAll()
-        self.selection_changed_weeks()
 
     # noinspection PyTypeChecker
     def set_cache_dir(self):
@@ -1154,75 +1345,95 @@ class MyWindow(QtWidgets.QMainWindow):
         )
 
     def clear_cache_dir(self):
-        shutil.rmtree(self.cache_directory,
-                      ignore_errors=False)
-        os.makedirs(self.cache_directory)
+        # The cache is moved aside and recreated empty straight away, then the
+        # old files are deleted in the background without freezing the window
+        removed_cache_directory = f"{self.cache_directory}.removed.{time.time_ns()}"
+        try:
+            os.rename(self.cache_directory, removed_cache_directory)
+        except FileNotFoundError:
+            removed_cache_directory = None
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        if removed_cache_directory:
+            runnable = RemoveTreeRunnable(removed_cache_directory)
+            runnable.signals.finished.connect(self.cache_dir_removed)
+            self.cache_removals.add(runnable)
+            QtCore.QThreadPool.globalInstance().start(runnable)
+
+    def cache_dir_removed(self, path, error):
+        self.cache_removals = {r for r in self.cache_removals if r.path != path}
+        if error:
+            print(f"Error clearing cache: {error}")
+            self.statusBar().showMessage(f"Error clearing cache: {error}")
 
     def set_use_cache(self):
         self.use_cache = not self.use_cache
 
-    def set_dark_theme(self):
+    def set_theme_palette(self, theme):
+        # Setting the application palette repolishes every widget, so only do it on a change
+        if theme == self.theme:
+            return False
         app = QtWidgets.QApplication.instance()
-        palette = app.palette()
-        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(50, 50, 50))
-        palette.setColor(QtGui.QPalette.Button, QtGui.QColor(70, 70, 70))
-        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.Text, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(70, 70, 70))
+        # Each theme's palette is only built the first time it is used
+        palette = self.theme_palettes.get(theme)
+        if palette is None:
+            palette = app.palette()
+            for role, rgb in THEME_COLORS[theme].items():
+                palette.setColor(role, QtGui.QColor(*rgb))
+            self.theme_palettes[theme] = palette
         app.setPalette(palette)
-        self.setStyleSheet(f'font-size: {self.font_size}px')
-        self.use_dark_theme = True
-        self.update_chart()
+        self.theme = theme
+        return True
+
+    def set_font_stylesheet(self):
+        stylesheet = f'font-size: {self.font_size}px'
+        if stylesheet == self.styleSheet():
+            return False
+        self.setStyleSheet(stylesheet)
+        return True
+
+    def set_dark_theme(self):
+        if self.set_theme_palette("dark"):
+            # The widgets styled by the window stylesheet only pick up the new palette once repolished
+            self.setStyleSheet(f'font-size: {self.font_size}px')
+            self.use_dark_theme = True
+            self.schedule_update()
 
     def set_light_theme(self):
-        app = QtWidgets.QApplication.instance()
-        palette = app.palette()
-        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(239, 239, 239))
-        palette.setColor(QtGui.QPalette.Button, QtGui.QColor(239, 239, 239))
-        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(0, 0, 0))
-        palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor(0, 0, 0))
-        palette.setColor(QtGui.QPalette.Text, QtGui.QColor(0, 0, 0))
-        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(255, 255, 255))
-        app.setPalette(palette)
-        self.setStyleSheet(f'font-size: {self.font_size}px')
-        self.use_dark_theme = False
-        self.update_chart()
+        if self.set_theme_palette("light"):
+            # The widgets styled by the window stylesheet only pick up the new palette once repolished
+            self.setStyleSheet(f'font-size: {self.font_size}px')
+            self.use_dark_theme = False
+            self.schedule_update()
 
     def checkbox_changed_improvements(self):
         if self.improvement_warning_checkbox.isChecked():
             self.improvement_warning_spin_box.setEnabled(True)
         else:
             self.improvement_warning_spin_box.setEnabled(False)
-        self.update_chart()
+        self.schedule_update()
 
     def checkbox_changed_regressions(self):
         if self.regression_warning_checkbox.isChecked():
             self.regression_warning_spin_box.setEnabled(True)
         else:
             self.regression_warning_spin_box.setEnabled(False)
-        self.update_chart()
+        self.schedule_update()
 
     def checkbox_changed_full_paths(self):
-        for row in range(self.logs_list.count()):
-            item = self.logs_list.item(row)
-            user_role_dict = item.data(QtCore.Qt.UserRole)
-            if self.show_full_paths_checkbox.isChecked():
-                item.setText(user_role_dict["path"])
-            else:
-                item.setText(user_role_dict["name"])
+        self.logs_model.set_show_full_paths(self.show_full_paths_checkbox.isChecked())
 
     def font_size_increase(self):
         if self.font_size <= 50:
             self.font_size += 2
-            self.setStyleSheet(f'font-size: {self.font_size}px')
-            self.update_chart(resize=False)
+            if self.set_font_stylesheet():
+                self.schedule_update(resize=False)
 
     def font_size_decrease(self):
         if self.font_size >= 5:
             self.font_size -= 2
-            self.setStyleSheet(f'font-size: {self.font_size}px')
-            self.update_chart(resize=False)
+            if self.set_font_stylesheet():
+                self.schedule_update(resize=False)
 
     def set_chart_label_angle(self):
         angle, ok = QtWidgets.QInputDialog.getDouble(self,
@@ -1233,111 +1444,75 @@ class MyWindow(QtWidgets.QMainWindow):
 
         if ok:
             self.chart_label_angle = angle
-            self.update_chart()
+            self.schedule_update()
 
     def show_all_stats(self):
-        for stat in self.chart_stats_checkboxes.keys():
-            self.chart_stats_checkboxes[stat].setChecked(True)
-        self.show_hide_vector_checkbox.setChecked(True)
-        self.show_hide_scalar_checkbox.setChecked(True)
-        self.show_hide_render_prep_checkbox.setChecked(True)
-        self.update_chart(resize=True)
+        self.stats_model.set_checked(self.stats_model.stats(), True)
+        self.set_category_checkboxes_checked(True)
+        self.schedule_update(resize=True)
 
     def hide_all_stats(self):
-        for stat in self.chart_stats_checkboxes.keys():
-            self.chart_stats_checkboxes[stat].setChecked(False)
-
-        self.show_hide_vector_checkbox.setChecked(False)
-        self.show_hide_scalar_checkbox.setChecked(False)
-        self.show_hide_render_prep_checkbox.setChecked(False)
-        self.update_chart()
+        self.stats_model.set_checked(self.stats_model.stats(), False)
+        self.set_category_checkboxes_checked(False)
+        self.schedule_update()
+
+    def set_category_checkboxes_checked(self, checked):
+        # The stats were already updated as a whole, so the category slots don't need to run
+        for checkbox in [self.show_hide_vector_checkbox,
+                         self.show_hide_scalar_checkbox,
+                         self.show_hide_render_prep_checkbox]:
+            blocked = checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(blocked)
 
     def show_hide_scalar_stats(self):
-        for stat in self.render_profile_chart.scalar_stats:
-            if self.show_hide_scalar_checkbox.isChecked():
-                self.chart_stats_checkboxes[stat].setChecked(True)
-            else:
-                self.chart_stats_checkboxes[stat].setChecked(False)
-        self.update_chart(resize=False)
+        self.stats_model.set_checked(self.render_profile_chart.scalar_stats,
+                                     self.show_hide_scalar_checkbox.isChecked())
+        self.schedule_update(resize=False)
 
     def show_hide_render_prep_stats(self):
-        for stat in self.render_profile_chart.render_prep_stats:
-            if self.show_hide_render_prep_checkbox.isChecked():
-                self.chart_stats_checkboxes[stat].setChecked(True)
-            else:
-                self.chart_stats_checkboxes[stat].setChecked(False)
-        self.update_chart(resize=False)
+        self.stats_model.set_checked(self.render_profile_chart.render_prep_stats,
+                                     self.show_hide_render_prep_checkbox.isChecked())
+        self.schedule_update(resize=False)
 
     def show_hide_vector_stats(self):
-        for stat in self.render_profile_chart.vector_stats:
-            if self.show_hide_vector_checkbox.isChecked():
-                self.chart_stats_checkboxes[stat].setChecked(True)
-            else:
-                self.chart_stats_checkboxes[stat].setChecked(False)
-        self.update_chart(resize=False)
+        self.stats_model.set_checked(self.render_profile_chart.vector_stats,
+                                     self.show_hide_vector_checkbox.isChecked())
+        self.schedule_update(resize=False)
 
     def show_pixel_samples(self):
-        stats = self.render_profile_chart.render_prep_stats +\
-                self.render_profile_chart.scalar_stats +\
-                self.render_profile_chart.vector_stats +\
-                self.render_profile_chart.xpu_stats
+        stats = self.render_profile_chart.time_stats_set
         if self.show_pixel_samples_checkbox.isChecked():
             self.show_memory_checkbox.setChecked(False)
             self.show_hide_render_prep_checkbox.setEnabled(False)
             self.show_hide_scalar_checkbox.setEnabled(False)
             self.show_hide_vector_checkbox.setEnabled(False)
-            for stat in stats:
-                self.chart_stats_checkboxes[stat].setEnabled(False)
+            self.stats_model.set_enabled(stats, False)
         else:
             self.show_hide_render_prep_checkbox.setEnabled(True)
             self.show_hide_scalar_checkbox.setEnabled(True)
             self.show_hide_vector_checkbox.setEnabled(True)
-            for stat in stats:
-                self.chart_stats_checkboxes[stat].setEnabled(True)
-        self.update_chart(resize=True)
+            self.stats_model.set_enabled(stats, True)
+        self.schedule_update(resize=True)
 
     def show_memory(self):
-        stats = self.render_profile_chart.render_prep_stats + \
-                self.render_profile_chart.scalar_stats + \
-                self.render_profile_chart.vector_stats + \
-                self.render_profile_chart.xpu_stats
+        stats = self.render_profile_chart.time_stats_set
         if self.show_memory_checkbox.isChecked():
             self.show_pixel_samples_checkbox.setChecked(False)
             self.show_hide_render_prep_checkbox.setEnabled(False)
             self.show_hide_scalar_checkbox.setEnabled(False)
             self.show_hide_vector_checkbox.setEnabled(False)
-            for stat in stats:
-                self.chart_stats_checkboxes[stat].setEnabled(False)
-            for stat in self.render_profile_chart.memory_stats:
-                self.chart_stats_checkboxes[stat].setChecked(True)
-                self.chart_stats_checkboxes[stat].setEnabled(True)
+            self.stats_model.set_enabled(stats, False)
+            self.stats_model.set_checked(self.render_profile_chart.memory_stats, True)
+            self.stats_model.set_enabled(self.render_profile_chart.memory_stats, True)
         else:
             self.show_hide_render_prep_checkbox.setEnabled(True)
             self.show_hide_scalar_checkbox.setEnabled(True)
             self.show_hide_vector_checkbox.setEnabled(True)
-            for stat in stats:
-                self.chart_stats_checkboxes[stat].setEnabled(True)
-            for stat in self.render_profile_chart.memory_stats:
-                self.chart_stats_checkboxes[stat].setChecked(False)
-                self.chart_stats_checkboxes[stat].setEnabled(False)
-        self.update_chart(resize=True)
-
-    def add_stat_checkbox(self, stat, stats_widget, default_state=True):
-        check_box = QtWidgets.QCheckBox(stat)
-        check_box.setChecked(default_state)
-        check_box.setSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
-        check_box.setFixedHeight(18)
-        check_box.clicked.connect(lambda: self.update_chart(resize=False))
-
-        check_box_color = self.render_profile_chart.stat_colors[stat]
-        pal = QtGui.QPalette()
-        pal.setColor(QtGui.QPalette.Window, check_box_color)
-        pal.setColor(QtGui.QPalette.Base, check_box_color)
-        check_box.setPalette(pal)
-        check_box.update()
-
-        stats_widget.layout().addWidget(check_box)
-        self.chart_stats_checkboxes[stat] = check_box
+            self.stats_model.set_enabled(stats, True)
+            self.stats_model.set_checked(self.render_profile_chart.memory_stats, False)
+            self.stats_model.set_enabled(self.render_profile_chart.memory_stats, False)
+        self.schedule_update(resize=True)
 
     def get_test_dir(self, test_name):
         return os.path.join(self.profile_directory, test_name)
@@ -1352,13 +1527,7 @@ class MyWindow(QtWidgets.QMainWindow):
 
         test_name = self.tests_list.selectedItems()[0].text()
 
-        weeks = set()
-        test_dir = self.get_test_dir(test_name)
-        with os.scandir(test_dir) as files:
-            for f in files:
-                if not f.is_dir():
-                    week = f.name.split('_')[0]
-                    weeks.add(week)
+        weeks, _ = self.scan_test_dir(test_name)
 
         self.process_weeks = False
         for w in sorted(weeks):
@@ -1373,20 +1542,27 @@ class MyWindow(QtWidgets.QMainWindow):
         self.show_image(test_name)
 
         # Clear all image tabs except Generic Image
-        self.image_tab_widget.clear()
-        self.image_tab_widget.addTab(self.generic_image_widget, "Generic Image")
-        self.resize_image()
-
-    def get_log_path(self, test_name, week, exec_mode):
+        if self.image_tab_widget is not None:
+            self.image_tab_widget.clear()
+            self.image_tab_widget.addTab(self.generic_image_widget, "Generic Image")
+            self.resize_image()
+
+    def scan_test_dir(self, test_name):
+        # The weeks of a test and its logs by (week, exec_mode) are gathered in a single
+        # scan, which is only done again once files are added to or removed from the test
         test_dir = self.get_test_dir(test_name)
-        with os.scandir(test_dir) as files:
-            for f in files:
-                if not f.is_dir():
-                    if fnmatch.fnmatch(f.name, f"{week}_*_{exec_mode}.txt"):
-                        log_path = os.path.join(test_dir, f.name)
-                        return log_path
+        mtime_ns = os.stat(test_dir).st_mtime_ns
+        test_dir_scan = self.test_dir_scans.get(test_dir)
+        if test_dir_scan is not None and test_dir_scan[0] == mtime_ns:
+            return test_dir_scan[1:]
 
-        return None
+        weeks, log_paths = list_test_logs(test_dir)
+        self.test_dir_scans[test_dir] = (mtime_ns, weeks, log_paths)
+        return weeks, log_paths
+
+    def get_log_path(self, test_name, week, exec_mode):
+        _, log_paths = self.scan_test_dir(test_name)
+        return get_week_log_path(log_paths, week, exec_mode)
 
     @staticmethod
     def find_text_in_browser(search_text, browser_widget):
@@ -1395,12 +1571,29 @@ class MyWindow(QtWidgets.QMainWindow):
         text_format.setBackground(palette.brush(QtGui.QPalette.Normal, QtGui.QPalette.Highlight))
         text_format.setForeground(palette.brush(QtGui.QPalette.Normal, QtGui.QPalette.HighlightedText))
         doc = browser_widget.document()
-        cur = QtGui.QTextCursor()
         selections = []
-        while 1:
-            cur = doc.find(search_text, cur)
-            if cur.isNull():
-                break
+        if not search_text:
+            browser_widget.setExtraSelections(selections)
+            return
+
+        # Searching a plain text snapshot is much faster than QTextDocument.find, but its
+        # offsets only match the document positions when every character is a single UTF-16 unit
+        text = doc.toPlainText()
+        if len(text) + 1 == doc.characterCount():
+            matches = ((m.start(), m.end()) for m in get_search_pattern(search_text).finditer(text))
+        else:
+            matches = list()
+            cur = QtGui.QTextCursor()
+            while 1:
+                cur = doc.find(search_text, cur)
+                if cur.isNull():
+                    break
+                matches.append((cur.selectionStart(), cur.selectionEnd()))
+
+        for start, end in matches:
+            cur = QtGui.QTextCursor(doc)
+            cur.setPosition(start)
+            cur.setPosition(end, QtGui.QTextCursor.KeepAnchor)
             sel = QtWidgets.QTextEdit.ExtraSelection()
             sel.cursor = cur
             sel.format = text_format
@@ -1409,47 +1602,71 @@ class MyWindow(QtWidgets.QMainWindow):
 
     def create_log_widget(self, log_path):
         log_widget = QtWidgets.QWidget()
-        log_widget.setLayout(QtWidgets.QVBoxLayout())
-        log_browser = QtWidgets.QTextBrowser()
-        log_widget.layout().addWidget(log_browser)
+        log_layout = QtWidgets.QVBoxLayout(log_widget)
+        log_browser = self.create_log_browser()
+        log_layout.addWidget(log_browser)
         find_widget = QtWidgets.QWidget()
-        log_widget.layout().addWidget(find_widget)
-        find_widget.setLayout(QtWidgets.QHBoxLayout())
-        search_label = QtWidgets.QLabel("Search")
-        find_widget.layout().addWidget(search_label)
+        log_layout.addWidget(find_widget)
+        find_layout = QtWidgets.QHBoxLayout(find_widget)
+        find_layout.addWidget(QtWidgets.QLabel("Search"))
         find_text_edit = QtWidgets.QLineEdit()
         find_text_edit.setClearButtonEnabled(True)
-        find_text_edit.textChanged.connect(lambda: self.find_text_in_browser(find_text_edit.text(), log_browser))
-        find_widget.layout().addWidget(find_text_edit)
+        # Every match is highlighted, so the search only runs once typing pauses
+        # rather than for every character of the search text
+        find_timer = QtCore.QTimer(log_widget)
+        find_timer.setSingleShot(True)
+        find_timer.setInterval(200)
+        find_timer.timeout.connect(lambda: self.find_text_in_browser(find_text_edit.text(), log_browser))
+        find_text_edit.textChanged.connect(lambda: find_timer.start())
+        find_layout.addWidget(find_text_edit)
         self.set_log_text(log_browser, log_path)
         log_file_name = os.path.basename(log_path)
         self.log_tab_widget.addTab(log_widget, log_file_name)
 
-    def process_log(self, index, test_name, exec_mode, week, log_path):
-        if exec_mode not in self.stats[week]:
-            self.stats[week][exec_mode] = self.get_stats(test_name, week, log_path, exec_mode)
+    def clear_log_tabs(self):
+        # QTabWidget.clear only removes the tabs, the log widgets and their text are deleted here
+        if self.log_tab_widget is None:
+            return
+        log_widgets = [self.log_tab_widget.widget(i) for i in range(self.log_tab_widget.count())]
+        self.log_tab_widget.clear()
+        for log_widget in log_widgets:
+            log_widget.deleteLater()
+
+    def process_log(self, index, log_path):
         if index == 0 and self.chart_image_log_tab_widget.currentIndex() == 2:
             self.create_log_widget(log_path)
 
     def process_logs(self, test_name, exec_mode):
         # selectedItems needs to handle profile runs that run into the next day better.
+        log_paths = list()
         for i, item in enumerate(sorted(self.weeks_list.selectedItems())):
             week = item.text()
             if week not in self.stats:
                 self.stats[week] = dict()
             log_path = self.get_log_path(test_name, week, exec_mode)
             if not log_path:
-                next_day = str(datetime.datetime.strptime(week, "%Y-%m-%d").date() +
-                               datetime.timedelta(days=1))
-                log_path = self.get_log_path(test_name, next_day, exec_mode)
-                if not log_path:
-                    prev_day = str(datetime.datetime.strptime(week, "%Y-%m-%d").date() -
-                                   datetime.timedelta(days=1))
-                    log_path = self.get_log_path(test_name, prev_day, exec_mode)
-                    if not log_path:
-                        self.stats[week][exec_mode] = "missing"
-            if log_path:
-                self.process_log(i, test_name, exec_mode, week, log_path)
+                self.stats[week][exec_mode] = "missing"
+            else:
+                log_paths.append((i, week, log_path))
+
+        # The stats are read from the cache files first, and the logs without one are parsed together
+        uncached_logs = list()
+        for _, week, log_path in log_paths:
+            if exec_mode in self.stats[week]:
+                continue
+            cache_file_path = self.get_cache_file_path(test_name, week, exec_mode)
+            if self.use_cache:
+                try:
+                    self.stats[week][exec_mode] = self.get_cached_stats(cache_file_path)
+                    continue
+                except (FileNotFoundError, ValueError):
+                    pass
+            uncached_logs.append((week, log_path, cache_file_path))
+        parsed_stats = self.parse_logs([log_path for _, log_path, _ in uncached_logs])
+        for week, log_path, cache_file_path in uncached_logs:
+            self.stats[week][exec_mode] = self.get_log_stats(log_path, cache_file_path, parsed_stats)
+        for i, _, log_path in log_paths:
+            self.process_log(i, log_path)
 
     def selection_changed_weeks(self):
         if not self.process_weeks:
@@ -1458,7 +1675,7 @@ class MyWindow(QtWidgets.QMainWindow):
         if len(self.tests_list.selectedItems()) == 0:
             return
 
-        self.log_tab_widget.clear()
+        self.clear_log_tabs()
         test_name = self.tests_list.selectedItems()[0].text()
         if self.scalar_checkbox.isChecked():
             self.process_logs(test_name, 'scalar')
@@ -1467,7 +1684,7 @@ class MyWindow(QtWidgets.QMainWindow):
         if self.xpu_checkbox.isChecked():
             self.process_logs(test_name, 'xpu')
 
-        self.update_chart(resize=True)
+        self.schedule_update(resize=True)
 
     def get_unique_test_name(self, test_name, log_file):
         dir_name = os.path.dirname(log_file)
@@ -1480,13 +1697,19 @@ class MyWindow(QtWidgets.QMainWindow):
 
     def selection_changed_logs(self):
         self.stats.clear()
-        if len(self.logs_list.selectedItems()) == 0:
+        selected_indexes = self.logs_list.selectionModel().selectedRows()
+        if len(selected_indexes) == 0:
             return
 
-        self.log_tab_widget.clear()
+        self.clear_log_tabs()
+        # The cache file names depend on the other selected logs, so the logs are only
+        # parsed together first when the cache isn't used
+        parsed_stats = None
+        if not self.use_cache:
+            parsed_stats = self.parse_logs([index.data(QtCore.Qt.UserRole)["path"] for index in selected_indexes])
         current_tab_index = self.chart_image_log_tab_widget.currentIndex()
-        for i, item in enumerate(self.logs_list.selectedItems()):
-            user_role_dict = item.data(QtCore.Qt.UserRole)
+        for i, index in enumerate(selected_indexes):
+            user_role_dict = index.data(QtCore.Qt.UserRole)
             log_file = user_role_dict["path"]
             test_name = user_role_dict["name"]
             test_display_name = user_role_dict["name"]
@@ -1495,15 +1718,16 @@ class MyWindow(QtWidgets.QMainWindow):
             week = 'none'
 
             log_type = 'scalar'
-            if fnmatch.fnmatch(test_name, f"*_vector.txt"):
+            if test_name.endswith("_vector.txt"):
                 log_type = 'vector'
-            if fnmatch.fnmatch(test_name, f"*_xpu.txt"):
+            if test_name.endswith("_xpu.txt"):
                 log_type = 'xpu'
 
             stats = self.get_stats(test_name,
                                    week,
                                    log_file,
-                                   log_type)
+                                   log_type,
+                                   parsed_stats)
 
             if stats:
                 self.stats[test_name] = dict()
@@ -1511,32 +1735,160 @@ class MyWindow(QtWidgets.QMainWindow):
                 self.stats[test_name][log_type]['display_name'] = test_display_name
 
             if i == 0 and current_tab_index == 2:
-                log_widget = QtWidgets.QTextBrowser()
+                log_widget = self.create_log_browser()
                 self.set_log_text(log_widget, log_file)
                 self.log_tab_widget.addTab(log_widget, test_name)
 
-        self.update_chart(resize=True)
+        self.schedule_update(resize=True)
+
+    def tab_changed(self, index):
+        if index == 1 and self.image_tab_widget is None:
+            self.build_images_tab()
+        elif index == 2 and self.log_tab_widget is None:
+            self.build_logs_tab()
+        self.resize_image()
+
+    def build_images_tab(self):
+        self.image_tab_widget = QtWidgets.QTabWidget()
+        self.image_tab_widget.currentChanged.connect(self.image_tab_changed)
+        self.images_tab.layout().addWidget(self.image_tab_widget)
+
+        self.generic_image_widget = QtWidgets.QWidget()
+        self.image_tab_widget.addTab(self.generic_image_widget, "Generic Image")
+
+        generic_image_layout = QtWidgets.QVBoxLayout(self.generic_image_widget)
+
+        # Image error messages
+        self.image_error_message = QtWidgets.QLabel("")
+        self.image_error_message.setStyleSheet(f"color: rgb(255, 0, 0); font-size: 20px;")
+        generic_image_layout.addWidget(self.image_error_message)
+
+        # Image Label
+        self.image_label = QtWidgets.QLabel("")
+        generic_image_layout.addWidget(self.image_label)
+
+        if not self.log_file_mode:
+            image_warning_label2 = QtWidgets.QLabel("Warning, the image above is generic for the test "
+                                                    "and does not represent the selected weeks or log files.")
+            generic_image_layout.addWidget(image_warning_label2)
+            image_warning_label3 = QtWidgets.QLabel("Press the buttons below to show or convert the actual images.")
+            generic_image_layout.addWidget(image_warning_label3)
+
+        # Show images button
+        if self.log_file_mode:
+            self.show_images_button = QtWidgets.QPushButton("Show images for selected logs with r_view")
+        else:
+            self.show_images_button = QtWidgets.QPushButton("Show images for selected weeks with r_view")
+        self.show_images_button.setFixedWidth(250)
+        self.show_images_button.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
+        # Queued so the button is drawn released before the images are loaded
+        self.show_images_button.clicked.connect(self.show_selected_images, QtCore.Qt.QueuedConnection)
+        generic_image_layout.addWidget(self.show_images_button)
+
+        # Convert images button
+        if self.log_file_mode:
+            self.convert_images_button = QtWidgets.QPushButton("Convert images for selected logs")
+        else:
+            self.convert_images_button = QtWidgets.QPushButton("Convert images for selected weeks")
+
+        self.convert_images_button.setFixedWidth(250)
+        self.convert_images_button.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
+        self.convert_images_button.clicked.connect(self.convert_selected_images, QtCore.Qt.QueuedConnection)
+        generic_image_layout.addWidget(self.convert_images_button)
+
+        generic_image_layout.addStretch()
+
+        self.update_generic_image()
+
+    def build_logs_tab(self):
+        self.logs_tab.layout().addWidget(QtWidgets.QLabel("Select a week to display log files"))
+
+        self.log_tab_widget = QtWidgets.QTabWidget()
+        self.logs_tab.layout().addWidget(self.log_tab_widget)
 
     def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
         self.resize_image()
 
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        # The log parser workers would otherwise live as long as the application
+        if self.log_parser_pool is not None:
+            if sys.version_info >= (3, 9):
+                self.log_parser_pool.shutdown(cancel_futures=True)
+            else:
+                self.log_parser_pool.shutdown()
+            self.log_parser_pool = None
+        super().closeEvent(a0)
+
     def resize_image(self):
+        if self.image_tab_widget is None:
+            return
         sz = self.generic_image_widget.size()
         sz.setWidth(min(sz.width(), 1000))
         sz.setHeight(min(sz.height(), 600))
         image_path = self.image_label.property('image_path')
         if image_path:
-            pixmap = QtGui.QPixmap(image_path)
+            pixmap = self.load_pixmap(image_path)
         else:
             pixmap = QtGui.QPixmap()
-        self.image_label.setPixmap(pixmap.scaled(sz.width(), sz.height(),
-                                                 QtCore.Qt.KeepAspectRatio))
+        self.image_label.setPixmap(self.scale_pixmap(pixmap, sz.width(), sz.height(),
+                                                     QtCore.Qt.FastTransformation))
+
+    def load_pixmap(self, image_path):
+        # Images are decoded once and kept until they change on disk, so
+        # resizing the window or showing the same test again is instant
+        try:
+            key = (image_path, os.stat(image_path).st_mtime_ns)
+        except FileNotFoundError:
+            return QtGui.QPixmap()
+
+        pixmap = self.images_cache.get(key)
+        if pixmap is not None:
+            self.images_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = QtGui.QPixmap(image_path)
+        if pixmap.isNull():
+            return pixmap
+
+        self.images_cache[key] = pixmap
+        self.images_cache_bytes += self.get_pixmap_bytes(pixmap)
+        while self.images_cache_bytes > IMAGES_CACHE_BYTES and len(self.images_cache) > 1:
+            _, evicted_pixmap = self.images_cache.popitem(last=False)
+            self.images_cache_bytes -= self.get_pixmap_bytes(evicted_pixmap)
+        return pixmap
+
+    def scale_pixmap(self, pixmap, width, height, transformation_mode):
+        # The window is resized far more often than the size available to the image
+        # changes, so the last few scaled pixmaps are kept
+        if pixmap.isNull():
+            return pixmap
+        key = (pixmap.cacheKey(), width, height, transformation_mode)
+        scaled_pixmap = self.scaled_images_cache.get(key)
+        if scaled_pixmap is not None:
+            self.scaled_images_cache.move_to_end(key)
+            return scaled_pixmap
+
+        scaled_pixmap = pixmap.scaled(width, height, QtCore.Qt.KeepAspectRatio, transformation_mode)
+        self.scaled_images_cache[key] = scaled_pixmap
+        if len(self.scaled_images_cache) > SCALED_IMAGES_CACHE_SIZE:
+            self.scaled_images_cache.popitem(last=False)
+        return scaled_pixmap
+
+    @staticmethod
+    def get_pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
 
     def show_image(self, test_name):
         # Test name is like: "tests_differentials_scene_text_aux"
         # Remove the "tests_" prefix and "_aux" suffix
         image_base_name = '_'.join(test_name.split('_')[1:-1]) + ".jpg"
-        image_path = os.path.join(self.default_images_directory, image_base_name)
+        self.generic_image_path = os.path.join(self.default_images_directory, image_base_name)
+        self.update_generic_image()
+
+    def update_generic_image(self):
+        if self.image_tab_widget is None or self.generic_image_path is None:
+            return
+        image_path = self.generic_image_path
         self.image_label.setProperty('image_path', image_path)
         if os.path.exists(image_path):
             self.image_error_message.setText(f"")
@@ -1563,111 +1915,196 @@ class MyWindow(QtWidgets.QMainWindow):
                             return
         subprocess.Popen(cmd)
 
+    @staticmethod
+    def get_source_image_hash(source_image):
+        # Logs with the same name from different runs have different source images,
+        # so the converted images are named after the full path of their source
+        return hashlib.sha1(os.path.abspath(source_image).encode()).hexdigest()[:12]
+
+    @staticmethod
+    def is_converted_image_current(source_image, converted_image):
+        # Converted images are kept in the work directory between sessions, so
+        # they only need converting again when the source image is newer.
+        # Only complete conversions are moved to converted_image
+        try:
+            return os.stat(converted_image).st_mtime_ns >= os.stat(source_image).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
     def convert_selected_images(self):
+        # Events are handled while waiting on r_convert, so the button is disabled until the
+        # conversions finish and a click queued before that is ignored
+        if self.converting_images:
+            return
+        self.converting_images = True
+        self.convert_images_button.setEnabled(False)
+        try:
+            self.convert_images()
+        finally:
+            self.converting_images = False
+            self.convert_images_button.setEnabled(True)
+
+    def convert_images(self):
         # Clear all tabs except Generic Image
         self.image_tab_widget.clear()
         self.image_tab_widget.addTab(self.generic_image_widget, "Generic Image")
 
+        # Start all the stale conversions before waiting on any of them, so
+        # the r_convert processes decode their images in parallel
+        converted_images = list()
+        convert_processes = list()
         for week in self.stats:
             for typ in self.stats[week]:
-                QtCore.QCoreApplication.processEvents()
                 source_image = self.stats[week][typ]['output_image']
                 if not os.path.exists(source_image):
                     self.image_error_message.setText(f"Error: Image file not found: {source_image}")
                     continue
                 converted_image = os.path.basename(source_image)
                 base_name = os.path.splitext(converted_image)[0]
+                source_hash = self.get_source_image_hash(source_image)
                 if self.log_file_mode:
                     log_file_name = week
-                    converted_image = f"{log_file_name}_{typ}_{base_name}.jpg"
+                    converted_image = f"{log_file_name}_{typ}_{base_name}_{source_hash}.jpg"
                 else:
                     test_name = self.tests_list.selectedItems()[0].text()
-                    converted_image = f"{test_name}_{week}_{typ}_{base_name}.jpg"
+                    converted_image = f"{test_name}_{week}_{typ}_{base_name}_{source_hash}.jpg"
 
                 converted_image = os.path.join(self.converted_images_directory, converted_image)
-                cmd = list()
-                cmd.append('/rel/folio/softmap_legacy/softmap_legacy-5.47.0-4/bin/r_convert')
-                cmd.append(source_image)
-                cmd.append(converted_image)
-                cmd.append('-compression')
-                cmd.append('none')
-                subprocess.run(cmd)
-
-                # Add tab for each converted image
-                image_widget = QtWidgets.QWidget()
-                image_widget.setLayout(QtWidgets.QVBoxLayout())
-                image_label = QtWidgets.QLabel("")
-                image_label.setProperty('image_path', converted_image)
-                sz = image_label.size()
-                pixmap = QtGui.QPixmap(converted_image)
-                image_label.setPixmap(pixmap.scaled(sz.width(), sz.height(),
-                                                    QtCore.Qt.KeepAspectRatio,
-                                                    QtCore.Qt.SmoothTransformation))
-                image_widget.layout().addWidget(image_label)
-                image_widget.layout().addStretch()
-
+                if not self.is_converted_image_current(source_image, converted_image):
+                    # Converted to a partial image of its own first, so a failed or killed
+                    # conversion never leaves an image that looks current
+                    partial_image_fd, partial_image = tempfile.mkstemp(
+                        dir=self.converted_images_directory,
+                        prefix=f"{os.path.splitext(os.path.basename(converted_image))[0]}.partial.",
+                        suffix='.jpg')
+                    os.close(partial_image_fd)
+                    cmd = list()
+                    cmd.append('/rel/folio/softmap_legacy/softmap_legacy-5.47.0-4/bin/r_convert')
+                    cmd.append(source_image)
+                    cmd.append(partial_image)
+                    cmd.append('-compression')
+                    cmd.append('none')
+                    convert_processes.append((subprocess.Popen(cmd), source_image, partial_image, converted_image))
                 if self.log_file_mode:
                     tab_name = self.stats[week][typ]['display_name']
                 else:
                     tab_name = f"{week}_{typ}"
+                converted_images.append((tab_name, converted_image))
+
+        # Events are only handled while waiting on the conversions, once the tab names
+        # no longer depend on the stats, which a new selection replaces
+        failed_images = set()
+        for process, source_image, partial_image, converted_image in convert_processes:
+            QtCore.QCoreApplication.processEvents()
+            if process.wait() == 0:
+                try:
+                    os.replace(partial_image, converted_image)
+                    continue
+                except FileNotFoundError:
+                    pass
+            self.image_error_message.setText(f"Error: Failed to convert image: {source_image}")
+            failed_images.add(converted_image)
+            try:
+                os.remove(partial_image)
+            except FileNotFoundError:
+                pass
+
+        for tab_name, converted_image in converted_images:
+            if converted_image in failed_images:
+                continue
+            # Add tab for each converted image
+            image_widget = QtWidgets.QWidget()
+            image_layout = QtWidgets.QVBoxLayout(image_widget)
+            image_label = QtWidgets.QLabel("")
+            image_label.setProperty('image_path', converted_image)
+            # Only the current tab is visible, so the image is decoded once its tab is shown
+            image_label.setProperty('pending_image_size', image_label.size())
+            image_layout.addWidget(image_label)
+            image_layout.addStretch()
+            self.image_tab_widget.addTab(image_widget, tab_name)
+
+    def image_tab_changed(self, index):
+        image_widget = self.image_tab_widget.widget(index)
+        if image_widget is None or image_widget is self.generic_image_widget:
+            return
+        image_label = image_widget.findChild(QtWidgets.QLabel)
+        sz = image_label.property('pending_image_size')
+        if sz is None:
+            return
+        image_label.setProperty('pending_image_size', None)
+        pixmap = self.load_pixmap(image_label.property('image_path'))
+        image_label.setPixmap(self.scale_pixmap(pixmap, sz.width(), sz.height(),
+                                                QtCore.Qt.SmoothTransformation))
 
-                self.image_tab_widget.addTab(image_widget, tab_name)
+    def schedule_update(self, resize=False):
+        self.pending_resize = self.pending_resize or bool(resize)
+        self.update_timer.start()
+
+    def scheduled_update(self):
+        resize = self.pending_resize
+        self.pending_resize = False
+        self.update_chart(resize=resize)
 
     def update_chart(self, resize=False):
-        stats_visibility_list = list()
-        for stat in self.chart_stats_checkboxes.keys():
-            if self.show_memory_checkbox.isChecked():
-                if stat in self.render_profile_chart.memory_stats and \
-                        self.chart_stats_checkboxes[stat].isChecked():
-                    stats_visibility_list.append(stat)
-            elif self.chart_stats_checkboxes[stat].isChecked():
-                stats_visibility_list.append(stat)
+        stats_visibility_list = self.stats_model.checked_stats()
+        if self.show_memory_checkbox.isChecked():
+            memory_stats = self.render_profile_chart.memory_stats_set
+            stats_visibility_list = [stat for stat in stats_visibility_list if stat in memory_stats]
 
         host_visibility_list = self.host_filter_line_edit.text().split()
 
-        my_stats = copy.deepcopy(self.stats)
-
-        # Divide by pixel samples
-        if self.divide_by_ps_checkbox.isChecked():
-            for week in my_stats:
-                for typ in my_stats[week]:
-                    if 'pixel_samples' in my_stats[week][typ]:
-                        pixel_samples = my_stats[week][typ]['pixel_samples'] * 1000000
-                        for stat_name in my_stats[week][typ]:
-                            if not stat_name == "pixel_samples" and isinstance(my_stats[week][typ][stat_name], float):
-                                my_stats[week][typ][stat_name] /= pixel_samples
+        # The stats are divided by pixel samples and their visible time is added in a single
+        # pass. They are flat dicts of numbers and strings, so copying each of them is enough
+        # to leave self.stats untouched
+        divide_by_ps = self.divide_by_ps_checkbox.isChecked()
+        show_pixel_samples = self.show_pixel_samples_checkbox.isChecked()
+        visible_stats = set(stats_visibility_list)
+        my_stats = dict()
+        for week, week_stats in self.stats.items():
+            my_week_stats = my_stats[week] = dict()
+            for typ, typ_stats in week_stats.items():
+                if isinstance(typ_stats, dict):
+                    typ_stats = dict(typ_stats)
+                my_week_stats[typ] = typ_stats
+
+                # Divide by pixel samples
+                if divide_by_ps:
+                    if isinstance(typ_stats, dict) and 'pixel_samples' in typ_stats:
+                        pixel_samples = typ_stats['pixel_samples'] * 1000000
+                        for stat_name, value in typ_stats.items():
+                            if not stat_name == "pixel_samples" and isinstance(value, float):
+                                typ_stats[stat_name] = value / pixel_samples
                     else:
                         print(f"Error: No pixel_samples data for {week}")
 
-        # Calculate total time for visible stats
-        for week in my_stats:
-            for test_type in my_stats[week]:
-                if not my_stats[week][test_type] or my_stats[week][test_type] == "missing":
+                # Calculate total time for visible stats
+                if not typ_stats or typ_stats == "missing":
                     continue
                 visible_time = 0.0
-                if self.show_pixel_samples_checkbox.isChecked():
-                    visible_time = my_stats[week][test_type]['pixel_samples']
+                if show_pixel_samples:
+                    visible_time = typ_stats['pixel_samples']
                 else:
-                    for stat in my_stats[week][test_type]:
-                        if stat in stats_visibility_list:
-                            visible_time += my_stats[week][test_type][stat]
-                my_stats[week][test_type]['visible_time'] = visible_time
+                    for stat_name, value in typ_stats.items():
+                        if stat_name in visible_stats:
+                            visible_time += value
+                typ_stats['visible_time'] = visible_time
 
-        type_visibility_list = list()
-        if self.scalar_checkbox.isChecked():
-            type_visibility_list.append('scalar')
-        if self.vector_checkbox.isChecked():
-            type_visibility_list.append('vector')
-        if self.xpu_checkbox.isChecked():
-            type_visibility_list.append('xpu')
+        type_visibility_list = [test_type for test_type, type_checkbox in self.type_checkboxes.items()
+                                if type_checkbox.isChecked()]
 
         if self.log_file_mode:
-            if len(self.logs_list.selectedItems()) > 1:
+            selected_indexes = self.logs_list.selectionModel().selectedRows()
+            if len(selected_indexes) == 0:
+                return
+            if len(selected_indexes) > 1:
                 test_name = ""
             else:
-                test_name = self.logs_list.selectedItems()[0].text()
+                test_name = selected_indexes[0].data()
         else:
-            test_name = self.tests_list.selectedItems()[0].text()
+            selected_items = self.tests_list.selectedItems()
+            if len(selected_items) == 0:
+                return
+            test_name = selected_items[0].text()
 
         self.render_profile_chart.update_chart(test_name,
                                                my_stats,
@@ -1690,184 +2127,171 @@ class MyWindow(QtWidgets.QMainWindow):
                                                self.show_crash_checkbox.isChecked(),
                                                self.chart_label_angle)
 
-    @staticmethod
-    def set_log_text(log_widget, log_file):
+    def set_log_text(self, log_widget, log_file):
         if not log_file:
-            log_widget.setText(f"Log: does not exist")
+            log_widget.setPlainText(f"Log: does not exist")
             return
 
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as log_file:
-                log_file_text = log_file.read()
-            log_widget.setText(log_file_text)
-        else:
-            log_widget.setText(f"Log: {log_file} does not exist")
+        # Large logs are read in the background. The text goes straight to the log widget,
+        # so a widget deleted before the read finishes is simply disconnected
+        runnable = ReadLogRunnable(log_file)
+        runnable.signals.finished.connect(log_widget.setPlainText)
+        runnable.signals.finished.connect(lambda: self.log_reads.discard(runnable))
+        self.log_reads.add(runnable)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    @staticmethod
+    def create_log_browser():
+        # Plain text documents are laid out line by line and only for the visible part,
+        # unlike rich text, which keeps large logs responsive
+        log_browser = QtWidgets.QPlainTextEdit()
+        log_browser.setReadOnly(True)
+        return log_browser
 
     def populate_test_list(self):
+        # The profile directory can be slow to list, so it is scanned in the background
         self.tests_list.clear()
-        with os.scandir(self.profile_directory) as test_dirs:
-            for t in test_dirs:
-                if t.is_dir():
-                    test_item = QtWidgets.QListWidgetItem(t.name)
-                    self.tests_list.addItem(test_item)
-
-    def add_log_file_to_list(self, log_file):
-        extension = os.path.splitext(log_file)[1]
-        if extension != '.txt' and extension != '.log':
+        runnable = ScanTestsRunnable(self.profile_directory)
+        runnable.signals.finished.connect(lambda *args: self.tests_scanned(runnable, *args))
+        self.test_scans.add(runnable)
+        self.current_test_scan = runnable
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    def tests_scanned(self, runnable, profile_directory, test_names, error):
+        self.test_scans.discard(runnable)
+        # Only the latest scan fills the list, even when an earlier one was of the same directory
+        if runnable is not self.current_test_scan:
             return
-        user_role_dict = dict()
-        path = os.path.abspath(log_file)
-        name = os.path.basename(path)
-        user_role_dict["name"] = name
-        user_role_dict["path"] = path
-        display_text = path
-        if self.show_full_paths_checkbox.isChecked():
-            display_text = path
-        item = QtWidgets.QListWidgetItem(display_text)
-        item.setData(QtCore.Qt.UserRole, user_role_dict)
-        item.setToolTip(path)
-        self.logs_list.addItem(item)
-
-    def add_log_files_to_list(self, log_file):
-        if os.path.isdir(log_file):
-            with os.scandir(log_file) as files:
-                for f in files:
-                    self.add_log_files_to_list(f.path)
-        else:
-            self.add_log_file_to_list(log_file)
+        self.current_test_scan = None
+        if error:
+            print(f"Error reading profile directory: {error}")
+            self.statusBar().showMessage(f"Error reading profile directory: {error}")
 
-    def populate_logs_list(self):
-        self.logs_list.clear()
-        for l in self.log_files:
-            self.add_log_files_to_list(l)
-        self.logs_list.sortItems()
-
-    def parse_log_file(self, log_file):
-        fallback_re = re.compile(r"Executing a (.*) render since execution mode was set to ([^.]*).")
-        in_breakdown = False
-        in_render_prep = False
-        in_render_prep_memory = False
-        found_wrote_line = False
-        found_breakdown = False
-        stats = dict()
-        stats['fallback'] = False
-        stats['crash'] = False
-        with open(log_file) as f:
-            for line in f:
-                match = fallback_re.match(line)
-                if match:
-                    if len(match.groups()) == 2:
-                        if (match.group(1) == 'scalar' and match.group(2) == 'xpu') or \
-                                (match.group(1) == 'vector' and match.group(2) == 'xpu') or \
-                                (match.group(1) == 'scalar' and match.group(2) == 'vector') or \
-                                (match.group(1) == 'vector' and match.group(2) == 'auto') or \
-                                (match.group(1) == 'scalar' and match.group(2) == 'auto'):
-                            stats['fallback'] = True
-                            stats['fallback_mode'] = match.group(1)
-                if in_breakdown:
-                    if 'Totals' in line:
-                        total_mcrt_time = line.split()[-2]
-                        total_mcrt_time = total_mcrt_time.replace(',', '')
-                        stats['total_mcrt_time'] = float(total_mcrt_time)
-                        stats['MCRT memory'] = get_gigabytes_from_size(line.split()[1], line.split()[2])
-                        if 'total_render_prep_memory' in stats:
-                            stats['MCRT memory'] = stats['MCRT memory'] - stats['total_render_prep_memory']
-                        in_breakdown = False
-                        continue
-                    if '----' in line or 'Total' in line or 'Avg Time per' in line:
-                        continue
-                    tokens = line.split(' ')
-                    stat_name = str()
-                    get_stat_name = False
-                    for t in tokens:
-                        if get_stat_name:
-                            if t == '':
-                                get_stat_name = False
-                            else:
-                                stat_name = stat_name + t + ' '
-                        if t == '|':
-                            get_stat_name = True
-                    stat_name = stat_name[0:-1]
-                    time = tokens[-2]
-                    time = time.replace(',', '')
-                    stats[stat_name] = float(time)
-                elif 'MCRT Time Breakdown' in line:
-                    in_breakdown = True
-                    found_breakdown = True
-                elif in_render_prep:
-                    if 'Total render prep' in line:
-                        stats['total_render_prep_time'] = get_seconds_from_time(line.split()[-1])
-                        in_render_prep = False
-                    else:
-                        for stat in self.render_profile_chart.render_prep_stats:
-                            if stat in line:
-                                stats[stat] = get_seconds_from_time(line.split()[-1])
-                elif 'Render Prep Stats' in line:
-                    in_render_prep = True
-                elif in_render_prep_memory:
-                    if 'Total memory' in line:
-                        stats['total_render_prep_memory'] = get_gigabytes_from_size(line.split()[-2], line.split()[-1])
-                        in_render_prep_memory = False
-                    else:
-                        for stat in self.render_profile_chart.memory_stats:
-                            if stat in line:
-                                stats[stat] = get_gigabytes_from_size(line.split()[-2], line.split()[-1])
-                elif 'Memory Summary' in line:
-                    in_render_prep_memory = True
-                elif 'Pixel samples' in line and 'Pixel samples sqrt' not in line:
-                    pixel_samples = line.split('=')[1]
-                    pixel_samples = pixel_samples.replace(',', '')
-                    pixel_samples = pixel_samples.replace(' ', '')
-                    pixel_samples = pixel_samples.replace('\n', '')
-                    stats['pixel_samples'] = float(pixel_samples) / 1000000
-                elif 'Host name' in line:
-                    host_name = line.split('=')[1]
-                    host_name = host_name.replace(' ', '')
-                    host_name = host_name.replace('\n', '')
-                    stats['host_name'] = host_name
-                elif 'Wrote' in line:
-                    if not found_wrote_line:
-                        output_image = line.split()[1]
-                        if output_image.endswith('Image.exr'):
-                            stats['output_image'] = output_image
-                            found_wrote_line = True
-                elif '-- Callstack:' in line:
-                    stats['crash'] = True
-
-        if not found_breakdown:
-            return None
+        self.tests_list.addItems(test_names)
 
-        return stats
+        # Select first row and show chars
+        self.tests_list.setCurrentRow(0)
+        self.weeks_list.selectAll()
 
-    def get_stats(self, test_name, week, log_file, log_type):
-        cache_file_name = f"{test_name}_{week}_{log_type}.json"
-        cache_file_path = os.path.join(self.cache_directory, cache_file_name)
+    def populate_logs_list(self):
+        # The log directories can be large, so they are scanned in the background
+        runnable = ScanLogsRunnable(self.log_files)
+        runnable.signals.finished.connect(self.logs_scanned)
+        self.log_scans.add(runnable)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    def logs_scanned(self, rows, error):
+        self.log_scans.clear()
+        if error:
+            print(f"Error reading logs: {error}")
+            self.statusBar().showMessage(f"Error reading logs: {error}")
+
+        # The whole list is handed to the model in one reset, then the first log is shown
+        self.logs_model.set_logs(rows)
+        self.logs_list.setCurrentIndex(self.logs_model.index(0))
 
-        # If the cache file exists then just load it and return the stats
-        if os.path.exists(cache_file_path) and self.use_cache:
-            with open(cache_file_path) as f:
-                try:
-                    stats = json.load(f)
-                except UnicodeDecodeError:
-                    print(f"Error reading {cache_file_path}")
-                    return None
-            return stats
+    @staticmethod
+    def get_log_stats_key(log_file):
+        log_file_stat = os.stat(log_file)
+        return os.path.abspath(log_file), log_file_stat.st_mtime_ns, log_file_stat.st_size
+
+    def add_log_stats(self, key, stats):
+        self.log_stats_cache[key] = stats
+        if len(self.log_stats_cache) > LOG_STATS_CACHE_SIZE:
+            self.log_stats_cache.popitem(last=False)
+
+    def load_log_stats(self, log_file, read_stats):
+        # Logs and their json cache files are read once and kept until they change on disk,
+        # so selecting the same logs again doesn't read them again
+        key = self.get_log_stats_key(log_file)
+        if key in self.log_stats_cache:
+            self.log_stats_cache.move_to_end(key)
+            stats = self.log_stats_cache[key]
+        else:
+            stats = read_stats(log_file)
+            self.add_log_stats(key, stats)
 
-        # If the cache file doesn't exist then parse the logs for the stats
-        if not os.path.exists(log_file):
+        # The callers add to the stats they get, so they get a copy
+        if stats is None:
+            return None
+        return dict(stats)
+
+    def parse_logs(self, log_files):
+        # Parsing is CPU bound, so the logs that aren't in log_stats_cache yet are parsed
+        # in parallel by worker processes. Their stats are returned by log file for get_stats,
+        # rather than added to log_stats_cache where a large batch would evict its own stats
+        parsed_stats = dict()
+        log_files_by_key = dict()
+        for log_file in log_files:
+            try:
+                key = self.get_log_stats_key(log_file)
+            except OSError:
+                continue
+            if key not in self.log_stats_cache:
+                log_files_by_key[key] = log_file
+        # Starting the workers takes longer than parsing a few small logs
+        if (len(log_files_by_key) < 2 or (os.cpu_count() or 1) < 2 or
+                sum(key[2] for key in log_files_by_key) < PARALLEL_PARSE_BYTES):
+            return parsed_stats
+
+        log_files = list(log_files_by_key.values())
+        try:
+            if self.log_parser_pool is None:
+                # Spawned rather than forked, as forking a process running Qt threads isn't safe
+                self.log_parser_pool = concurrent.futures.ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context('spawn'))
+            for log_file, stats in zip(log_files, self.log_parser_pool.map(parse_log_file, log_files)):
+                parsed_stats[log_file] = stats
+        except concurrent.futures.process.BrokenProcessPool as e:
+            # A worker died, the next logs are parsed by a new pool
+            self.log_parser_pool.shutdown()
+            self.log_parser_pool = None
+            self.statusBar().showMessage(f"Error parsing logs in parallel: {e}")
+        except (OSError, ValueError, IndexError):
+            # The logs left are parsed one by one by get_stats, which reports what went wrong
+            pass
+        return parsed_stats
+
+    def get_cache_file_path(self, test_name, week, log_type):
+        return os.path.join(self.cache_directory, get_cache_file_name(test_name, week, log_type))
+
+    def get_cached_stats(self, cache_file_path):
+        # Raises FileNotFoundError when there is no cache file and ValueError when it can't be
+        # decoded, the callers parse the log and rewrite its cache file instead
+        try:
+            return self.load_log_stats(cache_file_path, read_cache_file)
+        except ValueError as e:
+            print(f"Error reading {cache_file_path}: {e}")
+            raise
+
+    def get_log_stats(self, log_file, cache_file_path, parsed_stats=None):
+        # Logs already parsed by parse_logs aren't parsed again
+        read_stats = parse_log_file
+        if parsed_stats and log_file in parsed_stats:
+            read_stats = parsed_stats.get
+        try:
+            stats = self.load_log_stats(log_file, read_stats)
+        except FileNotFoundError:
             return None
-
-        stats = self.parse_log_file(log_file)
 
         # Write json cache file with the stats data
-        if not os.path.exists(os.path.dirname(cache_file_path)):
-            os.makedirs(os.path.dirname(cache_file_path))
-
-        with open(cache_file_path, "w") as f:
-            json.dump(stats, f, indent=4)
+        write_cache_file(cache_file_path, stats)
 
         return stats
 
+    def get_stats(self, test_name, week, log_file, log_type, parsed_stats=None):
+        cache_file_path = self.get_cache_file_path(test_name, week, log_type)
+
+        # If the cache file exists then just load it and return the stats
+        if self.use_cache:
+            try:
+                return self.get_cached_stats(cache_file_path)
+            except (FileNotFoundError, ValueError):
+                pass
+
+        # If the cache file doesn't exist then parse the logs for the stats
+        return self.get_log_stats(log_file, cache_file_path, parsed_stats)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Visualizes render profile"
@@ -0,0 +1,289 @@
+# Copyright 2024 DreamWorks Animation LLC
+# SPDX-License-Identifier: Apache-2.0
+
+# Parses the render profile logs into the stats shown by the viewer.
+#
+# This module doesn't depend on Qt, so the logs can also be parsed into the
+# viewer's cache directory ahead of time, by a faster interpreter like PyPy:
+#
+#     pypy3 -m render_profile_viewer.parser [profile_directory] [--cache-dir DIR]
+
+import io
+import os
+import json
+import datetime
+import functools
+import mmap
+import argparse
+import re
+
+DEFAULT_PROFILE_DIRECTORY = "/rel/ci_builds/Moonbase/ProfileRuns/latest_results/profile_reports"
+
+
+def get_seconds_from_time(time_string):
+    hours, minutes, seconds = time_string.split(':')[-3:]
+    return float(seconds) + float(minutes) * 60.0 + float(hours) * 3600.0
+
+
+SIZE_UNIT_GIGABYTES = {
+    "GB": 1.0,
+    "MB": 1.0 / 1024,
+    "KB": 1.0 / 1024 / 1024,
+}
+
+# Characters removed from the numbers and the host names of a log in a single pass
+NUMBER_SEPARATORS = str.maketrans('', '', ', \n')
+NAME_SEPARATORS = str.maketrans('', '', ' \n')
+
+
+def get_gigabytes_from_size(size_string, size_unit):
+    scale = SIZE_UNIT_GIGABYTES.get(size_unit)
+    if scale is None:
+        return None
+    return float(size_string) * scale
+
+
+FALLBACK_RE = re.compile(r"Executing a (.*) render since execution mode was set to ([^.]*).")
+
+# (executed mode, requested mode) pairs of a render that fell back to another execution mode
+FALLBACK_MODES = frozenset({("scalar", "xpu"),
+                            ("vector", "xpu"),
+                            ("scalar", "vector"),
+                            ("vector", "auto"),
+                            ("scalar", "auto")})
+
+# Stats read from the memory summary and the render prep sections of a log
+MEMORY_STATS = ("Geometry memory",
+                "BVH memory",
+                "MCRT memory")
+
+RENDER_PREP_STATS = ("Checkout license",
+                     "Loading scene",
+                     "Initialize renderer",
+                     "Generating procedurals",
+                     "Tessellation",
+                     "Building BVH",
+                     "Building GPU BVH")
+
+# Size of the blocks read from a log while parsing it
+LOG_READ_BUFFER_SIZE = 1024 * 1024
+
+BREAKDOWN_MARKER = b'MCRT Time Breakdown'
+
+
+def may_have_breakdown(log_bytes):
+    # Searching the mapped log is much faster than streaming it, so the logs of renders that
+    # never reached the breakdown are skipped without being parsed. Logs that can't be mapped,
+    # like empty ones, are parsed
+    try:
+        with mmap.mmap(log_bytes.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            return log_map.find(BREAKDOWN_MARKER) != -1
+    except (ValueError, OSError):
+        return True
+
+
+def parse_log_file(log_file, render_prep_stats=RENDER_PREP_STATS, memory_stats=MEMORY_STATS):
+    # A plain function of the log, so the logs can be parsed by worker processes
+    in_breakdown = False
+    in_render_prep = False
+    in_render_prep_memory = False
+    found_wrote_line = False
+    found_breakdown = False
+    stats = dict()
+    stats['fallback'] = False
+    stats['crash'] = False
+    # Logs are streamed line by line, read in large blocks for the network file systems they are
+    # often on. An undecodable byte only affects its own line instead of failing the whole log
+    with open(log_file, 'rb', buffering=LOG_READ_BUFFER_SIZE) as log_bytes:
+        if not may_have_breakdown(log_bytes):
+            return None
+        f = io.TextIOWrapper(log_bytes, encoding='utf-8', errors='replace')
+        for line in f:
+            match = FALLBACK_RE.match(line)
+            if match and match.groups() in FALLBACK_MODES:
+                stats['fallback'] = True
+                stats['fallback_mode'] = match.group(1)
+            if in_breakdown:
+                if 'Totals' in line:
+                    words = line.split()
+                    total_mcrt_time = words[-2].translate(NUMBER_SEPARATORS)
+                    stats['total_mcrt_time'] = float(total_mcrt_time)
+                    stats['MCRT memory'] = get_gigabytes_from_size(words[1], words[2])
+                    if 'total_render_prep_memory' in stats:
+                        stats['MCRT memory'] = stats['MCRT memory'] - stats['total_render_prep_memory']
+                    in_breakdown = False
+                    continue
+                # Only the rows with a '|' before the stat name are stats
+                if '----' in line or 'Total' in line or 'Avg Time per' in line or '|' not in line:
+                    continue
+                tokens = line.split(' ')
+                # The stat name is made of the words after the '|' up to the next double space
+                stat_name_tokens = list()
+                get_stat_name = False
+                for t in tokens:
+                    if get_stat_name:
+                        if t == '':
+                            get_stat_name = False
+                        else:
+                            stat_name_tokens.append(t)
+                    if t == '|':
+                        get_stat_name = True
+                stat_name = ' '.join(stat_name_tokens)
+                time = tokens[-2].translate(NUMBER_SEPARATORS)
+                stats[stat_name] = float(time)
+            elif 'MCRT Time Breakdown' in line:
+                in_breakdown = True
+                found_breakdown = True
+            elif in_render_prep:
+                if 'Total render prep' in line:
+                    stats['total_render_prep_time'] = get_seconds_from_time(line.rsplit(None, 1)[-1])
+                    in_render_prep = False
+                else:
+                    for stat in render_prep_stats:
+                        if stat in line:
+                            stats[stat] = get_seconds_from_time(line.rsplit(None, 1)[-1])
+            elif 'Render Prep Stats' in line:
+                in_render_prep = True
+            elif in_render_prep_memory:
+                if 'Total memory' in line:
+                    size, size_unit = line.rsplit(None, 2)[-2:]
+                    stats['total_render_prep_memory'] = get_gigabytes_from_size(size, size_unit)
+                    in_render_prep_memory = False
+                else:
+                    for stat in memory_stats:
+                        if stat in line:
+                            size, size_unit = line.rsplit(None, 2)[-2:]
+                            stats[stat] = get_gigabytes_from_size(size, size_unit)
+            elif 'Memory Summary' in line:
+                in_render_prep_memory = True
+            elif 'Pixel samples' in line and 'Pixel samples sqrt' not in line:
+                pixel_samples = line.split('=')[1].translate(NUMBER_SEPARATORS)
+                stats['pixel_samples'] = float(pixel_samples) / 1000000
+            elif 'Host name' in line:
+                host_name = line.split('=')[1].translate(NAME_SEPARATORS)
+                stats['host_name'] = host_name
+            elif 'Wrote' in line:
+                if not found_wrote_line:
+                    output_image = line.split()[1]
+                    if output_image.endswith('Image.exr'):
+                        stats['output_image'] = output_image
+                        found_wrote_line = True
+            elif '-- Callstack:' in line:
+                stats['crash'] = True
+
+    if not found_breakdown:
+        return None
+
+    return stats
+
+
+def list_test_dirs(profile_directory):
+    with os.scandir(profile_directory) as test_dirs:
+        return [t.name for t in test_dirs if t.is_dir()]
+
+
+def list_test_logs(test_dir):
+    # Returns the weeks of a test and its logs by (week, exec_mode)
+    weeks = set()
+    log_paths = dict()
+    with os.scandir(test_dir) as files:
+        for f in files:
+            # DirEntry.is_dir only needs a stat for symlinks, which are followed so that
+            # links to week directories are still skipped
+            if not f.is_dir():
+                week = f.name.split('_')[0]
+                weeks.add(week)
+                # Log names are like {week}_*_{exec_mode}.txt, the first one found is used
+                if f.name.endswith('.txt'):
+                    name_parts = f.name[len(week) + 1:-len('.txt')].rsplit('_', 1)
+                    if len(name_parts) == 2:
+                        log_paths.setdefault((week, name_parts[1]), f.path)
+    return weeks, log_paths
+
+
+@functools.lru_cache(maxsize=1024)
+def get_adjacent_days(week):
+    # The days after and before a week, where the logs of profile runs crossing midnight end up
+    date = datetime.datetime.strptime(week, "%Y-%m-%d").date()
+    one_day = datetime.timedelta(days=1)
+    return str(date + one_day), str(date - one_day)
+
+
+def get_week_log_path(log_paths, week, exec_mode):
+    # The log of a week, or else of the day after or before it. Its stats are cached under
+    # the week, both by the viewer and when filling the cache ahead of time
+    log_path = log_paths.get((week, exec_mode))
+    if log_path:
+        return log_path
+    next_day, prev_day = get_adjacent_days(week)
+    return log_paths.get((next_day, exec_mode)) or log_paths.get((prev_day, exec_mode))
+
+
+def get_cache_file_name(test_name, week, log_type):
+    return f"{test_name}_{week}_{log_type}.json"
+
+
+def read_cache_file(cache_file_path):
+    with open(cache_file_path) as f:
+        return json.load(f)
+
+
+def write_cache_file(cache_file_path, stats):
+    # Compact json, as it is only read back by the viewer. The file is written next to the
+    # cache file and then renamed over it, so a viewer reading the cache never sees half of it
+    temp_file_path = f"{cache_file_path}.{os.getpid()}.tmp"
+    try:
+        f = open(temp_file_path, "w")
+    except FileNotFoundError:
+        # The cache directory is only created the first time
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        f = open(temp_file_path, "w")
+
+    try:
+        with f:
+            json.dump(stats, f, separators=(',', ':'))
+        os.replace(temp_file_path, cache_file_path)
+    except BaseException:
+        os.remove(temp_file_path)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parses the render profile logs of every test"
+                                                 " into the cache directory of the viewer")
+    parser.add_argument('profile_directory', nargs='?', default=DEFAULT_PROFILE_DIRECTORY,
+                        help='directory with a subdirectory of logs per test')
+    parser.add_argument('--cache-dir', default=os.path.join(os.environ["HOME"], "render_profile_viewer", "cache"),
+                        help='cache directory of the viewer')
+    args = parser.parse_args()
+
+    for test_name in sorted(list_test_dirs(args.profile_directory)):
+        weeks, log_paths = list_test_logs(os.path.join(args.profile_directory, test_name))
+        log_types = sorted({log_type for _, log_type in log_paths})
+        # A log can be the one of several weeks, it is only parsed once
+        parsed_stats = dict()
+        for week in sorted(weeks):
+            for log_type in log_types:
+                # The cache files already there are the ones the viewer would use
+                cache_file_path = os.path.join(args.cache_dir, get_cache_file_name(test_name, week, log_type))
+                if os.path.exists(cache_file_path):
+                    continue
+                try:
+                    log_file = get_week_log_path(log_paths, week, log_type)
+                except ValueError:
+                    # Files that aren't named after a day have no adjacent days
+                    continue
+                if not log_file:
+                    continue
+                if log_file not in parsed_stats:
+                    try:
+                        parsed_stats[log_file] = parse_log_file(log_file)
+                    except (OSError, ValueError, IndexError) as e:
+                        print(f"Error parsing {log_file}: {e}")
+                        continue
+                write_cache_file(cache_file_path, parsed_stats[log_file])
+                print(cache_file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -32,18 +32,30 @@ if rezversion:
 # Pre-releases will always be 3 tokens, e.g. 1.2.3a0
 version = NUMPSEP.join(str(_) for _ in pyversion.split(NUMPSEP)[0:3])
 
+
+def _write_if_changed(path, content):
+    # Leave the file (and its mtime) alone when it already has this content so
+    # that incremental builds, like the docs, don't see it as modified.
+    try:
+        with open(path) as fh:
+            if fh.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, "w") as fh:
+        fh.write(content)
+
+
 # I stole this idea from setuptools_scm.
 versionfile = os.path.join(name, "_version.py")
-with open(versionfile, "w") as fh:
-    fh.write(os.linesep.join(
-        [
-            "# coding: utf-8",
-            "# file generated by setup.py",
-            "# don't change, don't track in version control",
-            "__version__ = '{}'".format(version)
-        ]
-    )
-    )
+_write_if_changed(versionfile, os.linesep.join(
+    [
+        "# coding: utf-8",
+        "# file generated by setup.py",
+        "# don't change, don't track in version control",
+        "__version__ = '{}'".format(version)
+    ]
+))
 
 setuptools.setup(version=version,
                  data_files=[(name, [versionfile])])
@@ -13,3 +13,8 @@ import render_profile_viewer
 def test_sample():
     assert 1 == 1
 
+
+def test_version():
+    # The version is loaded lazily on first access and then cached
+    assert isinstance(render_profile_viewer.__version__, str)
+    assert '__version__' in vars(render_profile_viewer)
@@ -0,0 +1,63 @@
+# Copyright 2024 DreamWorks Animation LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from render_profile_viewer import parser
+
+LOG_TEXT = """Host name           = ws10.example.com
+Pixel samples       = 1,100,567
+Pixel samples sqrt  = 12
+---------- Render Prep Stats ----------
+Loading scene                    00:00:10.2
+Total render prep                00:01:20.0
+---------- Memory Summary ----------
+Geometry memory                  1.5 GB
+BVH memory                       512 MB
+Total memory                     2.0 GB
+---------- MCRT Time Breakdown ----------
+---------------------------------------
+  0.5% | Render driver overhead                   1,000.0 s
+  1.5% | Integration                   2,000.0 s
+Totals 3.5 GB   something   3000.0 s
+Wrote /tmp/out/Image.exr
+"""
+
+
+def test_parse_log_file(tmp_path):
+    log_file = tmp_path / "2024-01-01_test_scalar.txt"
+    log_file.write_text(LOG_TEXT)
+    stats = parser.parse_log_file(str(log_file))
+    assert stats['host_name'] == "ws10.example.com"
+    assert stats['pixel_samples'] == 1.100567
+    assert stats['Loading scene'] == 10.2
+    assert stats['total_render_prep_time'] == 80.0
+    assert stats['BVH memory'] == 0.5
+    assert stats['Integration'] == 2000.0
+    assert stats['total_mcrt_time'] == 3000.0
+    assert stats['MCRT memory'] == 1.5
+    assert stats['output_image'] == "/tmp/out/Image.exr"
+    assert not stats['fallback'] and not stats['crash']
+
+
+def test_parse_log_file_without_breakdown(tmp_path):
+    log_file = tmp_path / "2024-01-01_test_scalar.txt"
+    log_file.write_text(LOG_TEXT.split("---------- MCRT")[0])
+    assert parser.parse_log_file(str(log_file)) is None
+
+
+def test_list_test_logs(tmp_path):
+    for name in ("2024-01-01_test_scalar.txt", "2024-01-01_test_vector.txt", "2024-01-08_notes.log"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "2024-01-15").mkdir()
+    weeks, log_paths = parser.list_test_logs(str(tmp_path))
+    assert weeks == {"2024-01-01", "2024-01-08"}
+    assert log_paths == {("2024-01-01", "scalar"): str(tmp_path / "2024-01-01_test_scalar.txt"),
+                         ("2024-01-01", "vector"): str(tmp_path / "2024-01-01_test_vector.txt")}
+
+
+def test_get_week_log_path():
+    log_paths = {("2024-01-02", "scalar"): "2024-01-02_test_scalar.txt",
+                 ("2024-01-07", "scalar"): "2024-01-07_test_scalar.txt"}
+    assert parser.get_week_log_path(log_paths, "2024-01-02", "scalar") == "2024-01-02_test_scalar.txt"
+    assert parser.get_week_log_path(log_paths, "2024-01-01", "scalar") == "2024-01-02_test_scalar.txt"
+    assert parser.get_week_log_path(log_paths, "2024-01-08", "scalar") == "2024-01-07_test_scalar.txt"
+    assert parser.get_week_log_path(log_paths, "2024-01-01", "vector") is None